@@ -16,6 +16,7 @@ celery_app = Celery(
         'app.services.token_refresh',    # Token refresh tasks
         'app.services.reminder_tasks',   # SIP/Loan reminder tasks
         'app.services.send_now_tasks',   # Manual send-now tasks
+        'app.services.webhook_tasks',    # Webhook replay tasks
     ]
 )
 
@@ -64,6 +65,14 @@ celery_app.conf.update(
             'task': 'app.services.campaign_tasks.check_pending_campaigns',
             'schedule': crontab(minute='*/1'),  # Every minute
         },
+        'reconcile-campaign-run-stats': {
+            'task': 'app.services.campaign_tasks.reconcile_campaign_run_stats',
+            'schedule': crontab(minute='*/15'),  # Every 15 minutes
+        },
+        'replay-failed-webhook-events': {
+            'task': 'app.services.webhook_tasks.replay_failed_webhook_events',
+            'schedule': crontab(minute='*/10'),  # Every 10 minutes
+        },
         'send-payment-reminders': {
             'task': 'app.services.reminder_tasks.send_payment_reminders',
             'schedule': crontab(hour=9, minute=0),  # Daily at 9:00 AM IST
@@ -5,6 +5,10 @@ from typing import Optional
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20  # Persistent connections per process
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed under burst load
+    DB_POOL_TIMEOUT: int = 5  # Seconds to wait for a free connection before failing
+    DB_POOL_RECYCLE: int = 3600  # Recycle connections before MySQL wait_timeout drops them
     
     # Security
     SECRET_KEY: str
@@ -24,6 +28,7 @@ class Settings(BaseSettings):
     WHATSAPP_APP_SECRET: str = ""  # Facebook App Secret
     WHATSAPP_WEBHOOK_VERIFY_TOKEN: str = ""  # Platform webhook verification token
     WHATSAPP_OTP_TEMPLATE_NAME: str = "otp_verification"  # Approved template name
+    WHATSAPP_SEND_CONCURRENCY: int = 20  # Max in-flight Graph API sends per bulk run
     
     # Payment Reminder Templates
     WHATSAPP_SIP_REMINDER_TEMPLATE: str = "gold_sip_template"  # Gold SIP due reminder
@@ -0,0 +1,60 @@
+"""
+Redis-backed cache for read-mostly query results.
+Every helper fails open: if Redis is unreachable the caller falls back to the database.
+"""
+import redis
+from app.config import settings
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """Return the shared Redis client (connection pool is created lazily)"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+    return _redis_client
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    """Get a cached value, or None on miss / Redis error"""
+    try:
+        return get_redis().get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+
+def cache_set(key: str, value, ttl_seconds: int) -> None:
+    """Store a value with an expiry; errors are logged and ignored"""
+    try:
+        get_redis().set(key, value, ex=ttl_seconds)
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+def cache_delete(key: str) -> None:
+    """Delete a single key; errors are logged and ignored"""
+    try:
+        get_redis().delete(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache invalidation failed for {key}: {e}")
+
+
+def cache_delete_pattern(pattern: str) -> None:
+    """Delete every key matching a glob pattern (e.g. "templates:active:*")"""
+    try:
+        client = get_redis()
+        keys = list(client.scan_iter(match=pattern))
+        if keys:
+            client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Cache invalidation failed for {pattern}: {e}")
@@ -4,10 +4,12 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from contextlib import asynccontextmanager
 import logging
+import sys
 
 from app.services import admin_routes, auth_routes, contact_routes, campaign_routes, template_routes, analytics_routes, webhook_routes, whatsapp_auth_routes, send_now_routes
 from app.database import engine, Base
 from app.config import settings
+from app.services.whatsapp_service import aclose_graph_clients
 
 # Configure logging
 logging.basicConfig(
@@ -26,12 +28,16 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan events"""
     logger.info("🎯 Starting EkTola API")
     yield
+    await aclose_graph_clients()
     logger.info("🛑 Shutting down EkTola API")
 
 # Middleware to add no-cache headers
 class NoCacheMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         response = await call_next(request)
+        # Endpoints that opt into caching (e.g. ETag-validated reads) set their own policy
+        if "cache-control" in response.headers:
+            return response
         # Add no-cache headers to prevent browser caching issues
         response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
         response.headers["Pragma"] = "no-cache"
@@ -100,5 +106,7 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        # Fail loudly if uvloop is missing rather than silently falling back; it has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
         reload=True if settings.ENVIRONMENT == "development" else False
     )
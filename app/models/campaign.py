@@ -1,7 +1,7 @@
 from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Boolean, Date, Time, Text, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from app.database import Base
+from app.database import Base, utcnow
 from app.utils.enums import CampaignType, CampaignStatus, RecurrenceType, SegmentType
 
 
@@ -39,7 +39,7 @@ class Campaign(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=utcnow(), nullable=False)
     
     # Relationships
     jeweller = relationship("Jeweller", back_populates="campaigns")
@@ -85,7 +85,7 @@ class CampaignRun(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=utcnow(), nullable=False)
     
     # Relationships
     campaign = relationship("Campaign", back_populates="campaign_runs")
@@ -1,7 +1,7 @@
 from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Text, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from app.database import Base
+from app.database import Base, utcnow
 from app.utils.enums import MessageStatus, MessageType, Language
 
 
@@ -50,7 +50,7 @@ class Message(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=utcnow(), nullable=False)
     
     # Relationships
     contact = relationship("Contact", back_populates="messages")
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, ForeignKey, JSON, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from app.database import Base
+from app.database import Base, utcnow
 from app.utils.enums import CampaignType, Language, SegmentType
 
 
@@ -28,11 +28,11 @@ class Template(Base):
     
     # Variables placeholders (e.g., {{1}}, {{2}})
     variable_count = Column(Integer, default=0)
-    variable_names = Column(Text, nullable=True)  # JSON array: ["customer_name", "amount"]
+    variable_names = Column(JSON, nullable=True)  # JSON array: ["customer_name", "amount"]
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=utcnow(), nullable=False)
     
     # Relationships
     translations = relationship("TemplateTranslation", back_populates="template", cascade="all, delete-orphan")
@@ -58,7 +58,7 @@ class TemplateTranslation(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=utcnow(), nullable=False)
     
     # Relationships
     template = relationship("Template", back_populates="translations")
\ No newline at end of file
@@ -2,7 +2,7 @@
 Admin Dashboard Schemas
 Request/Response models for admin endpoints
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict
 from datetime import datetime
 from app.utils.enums import ApprovalStatus, SegmentType, Language, CampaignType, CampaignStatus
@@ -53,8 +53,7 @@ class JewellerDetailResponse(BaseModel):
     # User email (from related User)
     email: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JewellerListResponse(BaseModel):
@@ -114,8 +113,7 @@ class ApproveJewellerResponse(BaseModel):
     approved_at: Optional[datetime] = None
     message: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============ Admin Contact Management Schemas ============
@@ -135,8 +133,7 @@ class AdminContactListResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AdminContactsPageResponse(BaseModel):
@@ -184,8 +181,7 @@ class AdminCampaignListResponse(BaseModel):
     total_runs: int = 0
     total_messages_sent: int = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AdminCampaignsPageResponse(BaseModel):
@@ -218,8 +214,7 @@ class AdminMessageResponse(BaseModel):
     failed_at: Optional[datetime] = None
     failure_reason: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AdminMessagesPageResponse(BaseModel):
@@ -276,8 +271,7 @@ class WhatsAppStatusResponse(BaseModel):
     last_token_refresh: Optional[datetime] = None
     fb_app_scoped_user_id: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============ Contact Purge & Restore Schemas ============
@@ -294,8 +288,7 @@ class DeletedContactResponse(BaseModel):
     deleted_at: Optional[datetime] = None
     days_since_deletion: int = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DeletedContactsListResponse(BaseModel):
@@ -1,8 +1,13 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints
+from typing import Annotated, Optional
 from datetime import datetime
 
 
+# Phone as typed by the user (digits, optional +, spaces/dashes/brackets).
+# Checked by pydantic-core; routes still normalize to E.164 before lookup.
+PhoneNumber = Annotated[str, StringConstraints(strip_whitespace=True, pattern=r"^\+?[0-9][0-9\s\-()]{6,19}$")]
+
+
 # ============ Authentication Schemas ============
 
 class Token(BaseModel):
@@ -29,7 +34,7 @@ class LoginRequest(BaseModel):
 
 class PhoneLoginRequest(BaseModel):
     """Login with phone and password (Jeweller)"""
-    phone_number: str
+    phone_number: PhoneNumber
     password: str
 
 
@@ -40,7 +45,7 @@ class OTPLoginRequest(BaseModel):
 
 class PhoneOTPRequest(BaseModel):
     """Request OTP via WhatsApp (Jeweller)"""
-    phone_number: str
+    phone_number: PhoneNumber
 
 
 class OTPVerifyRequest(BaseModel):
@@ -51,7 +56,7 @@ class OTPVerifyRequest(BaseModel):
 
 class PhoneOTPVerifyRequest(BaseModel):
     """Verify OTP code (WhatsApp - Jeweller)"""
-    phone_number: str
+    phone_number: PhoneNumber
     otp_code: str
 
 
@@ -60,7 +65,7 @@ class RegisterRequest(BaseModel):
     email: EmailStr
     password: str
     business_name: str
-    phone_number: str
+    phone_number: PhoneNumber
 
 
 class UserResponse(BaseModel):
@@ -71,8 +76,7 @@ class UserResponse(BaseModel):
     is_admin: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JewellerResponse(BaseModel):
@@ -88,8 +92,7 @@ class JewellerResponse(BaseModel):
     phone_number_id: Optional[str] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AdminRegisterRequest(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict
 from datetime import datetime, date, time
 from app.utils.enums import CampaignType, CampaignStatus, RecurrenceType, SegmentType
@@ -61,8 +61,7 @@ class CampaignResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CampaignListResponse(BaseModel):
@@ -89,8 +88,7 @@ class CampaignRunResponse(BaseModel):
     messages_read: int
     messages_failed: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CampaignStatsResponse(BaseModel):
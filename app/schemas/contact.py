@@ -1,9 +1,27 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field
+from typing import Annotated, Literal, Optional, List
 from datetime import datetime, date
 from app.utils.enums import SegmentType, Language
 
 
+_STRIP_MOBILE = str.maketrans("", "", "+ -")
+
+
+def _validate_mobile(v: str) -> str:
+    # Basic validation - will be normalized in the router
+    if len(v.translate(_STRIP_MOBILE)) < 10:
+        raise ValueError('Invalid mobile number')
+    return v
+
+
+def _upper(v):
+    return v.upper() if isinstance(v, str) else v
+
+
+MobileStr = Annotated[str, AfterValidator(_validate_mobile)]
+ContactPurpose = Annotated[Literal["SIP", "LOAN", "BOTH"], BeforeValidator(_upper)]
+
+
 # ============ Payment Schedule Schemas ============
 
 class PaymentScheduleUpdate(BaseModel):
@@ -55,8 +73,7 @@ class PaymentScheduleResponse(BaseModel):
     last_sip_reminder_sent_at: Optional[datetime]
     last_loan_reminder_sent_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentScheduleListResponse(BaseModel):
@@ -81,23 +98,9 @@ class ReminderPreviewResponse(BaseModel):
 class DashboardContactCreate(BaseModel):
     """Create single contact from dashboard (simplified format)"""
     name: str
-    mobile: str
-    purpose: str  # "SIP", "LOAN", or "BOTH"
+    mobile: MobileStr
+    purpose: ContactPurpose  # "SIP", "LOAN", or "BOTH" (case-insensitive)
     date: str  # Date string from form
-    
-    @validator('purpose')
-    def validate_purpose(cls, v):
-        valid_purposes = ['SIP', 'LOAN', 'BOTH']
-        if v.upper() not in valid_purposes:
-            raise ValueError(f'Purpose must be one of: {", ".join(valid_purposes)}')
-        return v.upper()
-    
-    @validator('mobile')
-    def validate_mobile(cls, v):
-        # Basic validation - will be normalized in the router
-        if not v or len(v.replace('+', '').replace(' ', '').replace('-', '')) < 10:
-            raise ValueError('Invalid mobile number')
-        return v
 
 
 class DashboardContactResponse(BaseModel):
@@ -109,8 +112,7 @@ class DashboardContactResponse(BaseModel):
     date: Optional[str]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='forbid', frozen=True)
 
 
 class DashboardBulkUploadReport(BaseModel):
@@ -191,8 +193,7 @@ class ContactResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='forbid', frozen=True)
 
 
 class ContactListResponse(BaseModel):
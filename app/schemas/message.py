@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 from app.utils.enums import MessageStatus, Language
@@ -25,8 +25,7 @@ class MessageResponse(BaseModel):
     failure_reason: Optional[str] = None
     retry_count: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='forbid', frozen=True)
 
 
 class MessageStatsResponse(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict
 from datetime import datetime
 from app.utils.enums import CampaignType, SegmentType, Language
@@ -26,8 +26,7 @@ class TemplateTranslationResponse(BaseModel):
     approval_status: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TemplateCreate(BaseModel):
@@ -80,13 +79,12 @@ class TemplateResponse(BaseModel):
     category: str
     is_active: bool
     variable_count: int
-    variable_names: Optional[str] = None
+    variable_names: Optional[List[str]] = None
     translations: List[TemplateTranslationResponse] = []
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='forbid', frozen=True)
 
 
 class TemplateListResponse(BaseModel):
@@ -110,8 +108,7 @@ class TemplateTranslationPreview(BaseModel):
     example_body: str
     example_footer: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TemplatePreviewResponse(BaseModel):
@@ -124,9 +121,8 @@ class TemplatePreviewResponse(BaseModel):
     description: Optional[str] = None
     category: str
     variable_count: int
-    variable_names: Optional[str] = None
+    variable_names: Optional[List[str]] = None
     dummy_values: Dict[str, str] = {}
     translations: List[TemplateTranslationPreview] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -570,7 +570,7 @@ async def admin_upload_contacts(
         if file.filename.endswith('.csv'):
             df = pd.read_csv(io.BytesIO(contents))
         else:
-            df = pd.read_excel(io.BytesIO(contents))
+            df = pd.read_excel(io.BytesIO(contents), engine="calamine")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -867,7 +867,6 @@ def admin_start_campaign(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Campaign is already active")
 
     campaign.status = CampaignStatus.ACTIVE
-    campaign.updated_at = now_utc()
     db.commit()
 
     return {
@@ -995,27 +994,24 @@ def get_jeweller_analytics(
         Campaign.status == CampaignStatus.ACTIVE,
     ).scalar() or 0
 
-    total_messages = db.query(func.count(Message.id)).filter(
-        Message.jeweller_id == jeweller_id,
-    ).scalar() or 0
-
-    messages_period = db.query(func.count(Message.id)).filter(
-        Message.jeweller_id == jeweller_id,
-        Message.created_at >= start_date,
-    ).scalar() or 0
-
-    # Delivery / read rates
-    stats = db.query(
+    # Message counts per status (all-time and in period) in one GROUP BY
+    status_rows = db.query(
+        Message.status,
         func.count(Message.id).label('total'),
-        func.sum(func.cast(Message.status == MessageStatus.DELIVERED, Integer)).label('delivered'),
-        func.sum(func.cast(Message.status == MessageStatus.READ, Integer)).label('read'),
+        func.sum(func.cast(Message.created_at >= start_date, Integer)).label('period'),
     ).filter(
         Message.jeweller_id == jeweller_id,
-    ).first()
+    ).group_by(Message.status).all()
 
-    total_stat = stats.total or 0
-    delivery_rate = (stats.delivered / total_stat * 100) if total_stat > 0 else 0
-    read_rate = (stats.read / stats.delivered * 100) if stats.delivered and stats.delivered > 0 else 0
+    status_counts = {row.status: row.total for row in status_rows}
+    total_messages = sum(status_counts.values())
+    messages_period = sum(int(row.period or 0) for row in status_rows)
+
+    # Delivery / read rates
+    delivered = status_counts.get(MessageStatus.DELIVERED, 0)
+    read = status_counts.get(MessageStatus.READ, 0)
+    delivery_rate = (delivered / total_messages * 100) if total_messages > 0 else 0
+    read_rate = (read / delivered * 100) if delivered > 0 else 0
 
     # Campaign success rates
     runs = db.query(CampaignRun).filter(
@@ -49,25 +49,21 @@ def get_jeweller_dashboard(
         Campaign.status == CampaignStatus.ACTIVE
     ).scalar()
     
-    # Total messages sent
-    total_messages = db.query(func.count(Message.id)).filter(
-        Message.jeweller_id == current_jeweller.id
-    ).scalar()
-    
-    # Last 30 days stats
+    # Message counts per status (all-time and last 30 days) in one GROUP BY
     thirty_days_ago = now_utc() - timedelta(days=30)
-    recent_stats = db.query(
+    status_rows = db.query(
+        Message.status,
         func.count(Message.id).label('total'),
-        func.sum(func.cast(Message.status == MessageStatus.DELIVERED, Integer)).label('delivered'),
-        func.sum(func.cast(Message.status == MessageStatus.READ, Integer)).label('read')
+        func.sum(func.cast(Message.created_at >= thirty_days_ago, Integer)).label('recent')
     ).filter(
-        Message.jeweller_id == current_jeweller.id,
-        Message.created_at >= thirty_days_ago
-    ).first()
+        Message.jeweller_id == current_jeweller.id
+    ).group_by(Message.status).all()
     
-    recent_total = recent_stats.total or 0
-    recent_delivered = recent_stats.delivered or 0
-    recent_read = recent_stats.read or 0
+    recent_by_status = {row.status: int(row.recent or 0) for row in status_rows}
+    total_messages = sum(row.total for row in status_rows)
+    recent_total = sum(recent_by_status.values())
+    recent_delivered = recent_by_status.get(MessageStatus.DELIVERED, 0)
+    recent_read = recent_by_status.get(MessageStatus.READ, 0)
     recent_delivery_rate = (recent_delivered / recent_total * 100) if recent_total > 0 else 0
     recent_read_rate = (recent_read / recent_delivered * 100) if recent_delivered > 0 else 0
     
@@ -151,17 +147,24 @@ def get_admin_dashboard(
         Contact.is_deleted == False
     ).scalar()
     
-    # Total messages - use COUNT(*) to avoid loading model columns
-    total_messages = db.execute(text("SELECT COUNT(*) FROM messages")).scalar() or 0
-    
-    # Messages last 30 days
+    # Message counts per status (all-time and last 30 days) in one GROUP BY
+    # Raw SQL to avoid model column issues
     thirty_days_ago = now_utc() - timedelta(days=30)
-    messages_30d = db.execute(text("SELECT COUNT(*) FROM messages WHERE created_at >= :date"), {"date": thirty_days_ago}).scalar() or 0
+    status_rows = db.execute(text("""
+        SELECT status,
+               COUNT(*) AS cnt,
+               SUM(CASE WHEN created_at >= :date THEN 1 ELSE 0 END) AS cnt_30d
+        FROM messages
+        GROUP BY status
+    """), {"date": thirty_days_ago}).fetchall()
+    
+    status_counts = {row.status: row.cnt for row in status_rows}
+    total_messages = sum(status_counts.values())
+    messages_30d = sum(int(row.cnt_30d or 0) for row in status_rows)
     
-    # Overall delivery and read rates - use raw SQL to avoid model column issues
     # NOTE: READ messages were also delivered, so delivered = DELIVERED + READ
-    overall_delivered = db.execute(text("SELECT COUNT(*) FROM messages WHERE status IN ('DELIVERED', 'READ')")).scalar() or 0
-    overall_read = db.execute(text("SELECT COUNT(*) FROM messages WHERE status = 'READ'")).scalar() or 0
+    overall_read = status_counts.get('READ', 0)
+    overall_delivered = status_counts.get('DELIVERED', 0) + overall_read
     overall_delivery_rate = (overall_delivered / total_messages * 100) if total_messages > 0 else 0
     overall_read_rate = (overall_read / overall_delivered * 100) if overall_delivered > 0 else 0
     
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, inspect, update
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.auth import (
@@ -10,14 +12,23 @@ from app.config import settings
 from app.models.user import User
 from app.models.jeweller import Jeweller
 from app.core.datetime_utils import now_utc
+from app.core.cache import cache_get, cache_set, cache_delete
 from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token
 from app.core.dependencies import get_current_user, create_token_data
 from app.services.whatsapp_service import send_whatsapp_otp, validate_phone_number, normalize_phone_number
 import secrets
 from datetime import datetime, timedelta
+from typing import Optional
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Negative cache for OTP requests against phone numbers with no account.
+# ORM writes of User.phone_number clear the entry (see _invalidate_unregistered_phone);
+# writers that bypass the ORM or this module (raw SQL, standalone scripts) are only
+# seen once the entry expires, so keep the TTL short.
+UNREGISTERED_PHONE_CACHE_PREFIX = "otp:unregistered:"
+UNREGISTERED_PHONE_CACHE_TTL = 60
+
 
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
 def register_jeweller(
@@ -75,6 +86,7 @@ def register_jeweller(
     )
     db.add(new_jeweller)
     db.commit()
+    cache_delete(f"{UNREGISTERED_PHONE_CACHE_PREFIX}{normalized_phone}")
     db.refresh(new_user)
     db.refresh(new_jeweller)
     
@@ -234,6 +246,32 @@ def request_otp(
     return {"message": "OTP sent to email", "otp": otp_code}
 
 
+def _find_otp_user(db: Session, phone_number: str) -> Optional[User]:
+    """Look up the user for an OTP request; unregistered numbers are answered from Redis"""
+    unregistered_key = f"{UNREGISTERED_PHONE_CACHE_PREFIX}{phone_number}"
+    if cache_get(unregistered_key):
+        return None
+    user = db.query(User).filter(User.phone_number == phone_number).first()
+    if not user:
+        cache_set(unregistered_key, "1", UNREGISTERED_PHONE_CACHE_TTL)
+    return user
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+def _invalidate_unregistered_phone(mapper, connection, target: User) -> None:
+    """Drop the negative OTP cache entry whenever a user's phone number is written"""
+    if target.phone_number and inspect(target).attrs.phone_number.history.has_changes():
+        cache_delete(f"{UNREGISTERED_PHONE_CACHE_PREFIX}{target.phone_number}")
+
+
+def _store_phone_otp(db: Session, user: User, otp_code: str, otp_expiry: datetime) -> None:
+    """Persist the OTP that was just sent"""
+    user.phone_otp_code = otp_code
+    user.phone_otp_expiry = otp_expiry
+    db.commit()
+
+
 @router.post("/otp/request/phone")
 async def request_phone_otp(
     request: PhoneOTPRequest,
@@ -251,7 +289,8 @@ async def request_phone_otp(
             detail="Invalid phone number format. Use 10 digits or +91 format"
         )
     
-    user = db.query(User).filter(User.phone_number == normalized_phone).first()
+    # Blocking Redis/DB calls run in the threadpool so the event loop stays free
+    user = await run_in_threadpool(_find_otp_user, db, normalized_phone)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -272,9 +311,7 @@ async def request_phone_otp(
         )
     
     # Store OTP in database
-    user.phone_otp_code = otp_code
-    user.phone_otp_expiry = otp_expiry
-    db.commit()
+    await run_in_threadpool(_store_phone_otp, db, user, otp_code, otp_expiry)
     
     # Return response (include OTP in dev mode only)
     response = {"message": "OTP sent to WhatsApp"}
@@ -357,7 +394,11 @@ def verify_phone_otp(
             detail="Invalid phone number format"
         )
     
-    user = db.query(User).filter(User.phone_number == normalized_phone).first()
+    # Load the user and their jeweller profile in one round trip
+    row = db.query(User, Jeweller).outerjoin(
+        Jeweller, Jeweller.user_id == User.id
+    ).filter(User.phone_number == normalized_phone).first()
+    user, jeweller = row if row else (None, None)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -388,16 +429,25 @@ def verify_phone_otp(
             detail="Invalid OTP"
         )
     
-    # Clear OTP
-    user.phone_otp_code = None
-    user.phone_otp_expiry = None
-    db.commit()
+    # Build the token payload before commit expires the loaded rows
+    token_data = create_token_data(user, jeweller)
     
-    # Get jeweller profile
-    jeweller = db.query(Jeweller).filter(Jeweller.user_id == user.id).first()
+    # Consume the OTP in a single conditional UPDATE; a concurrent verify of the
+    # same code matches zero rows, so each OTP can be used only once
+    consumed = db.execute(
+        update(User)
+        .where(User.id == user.id, User.phone_otp_code == request.otp_code)
+        .values(phone_otp_code=None, phone_otp_expiry=None)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    if not consumed:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid OTP"
+        )
     
     # Generate tokens
-    token_data = create_token_data(user, jeweller)
     access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data)
     
@@ -12,7 +12,6 @@ from app.schemas.campaign import (
     CampaignListResponse, CampaignRunResponse, CampaignStatsResponse
 )
 from app.utils.enums import CampaignType, CampaignStatus
-from datetime import datetime
 
 router = APIRouter(prefix="/campaigns", tags=["Campaigns"])
 
@@ -120,7 +119,6 @@ def update_campaign(
     for field, value in update_data.items():
         setattr(campaign, field, value)
     
-    campaign.updated_at = now_utc()
     db.commit()
     db.refresh(campaign)
     
@@ -152,7 +150,6 @@ def pause_campaign(
         )
     
     campaign.status = CampaignStatus.PAUSED
-    campaign.updated_at = now_utc()
     db.commit()
     db.refresh(campaign)
     
@@ -184,7 +181,6 @@ def resume_campaign(
         )
     
     campaign.status = CampaignStatus.ACTIVE
-    campaign.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(campaign)
     
@@ -216,7 +212,6 @@ def activate_campaign(
         )
     
     campaign.status = CampaignStatus.ACTIVE
-    campaign.updated_at = now_utc()
     db.commit()
     db.refresh(campaign)
     
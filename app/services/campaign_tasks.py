@@ -5,6 +5,8 @@ Background jobs for sending WhatsApp messages
 import ast
 import logging
 from datetime import timedelta
+from celery import group
+from sqlalchemy import func, lambda_stmt, select, update
 from sqlalchemy.orm import joinedload
 
 from app.celery_app import celery_app
@@ -22,6 +24,13 @@ from app.services.base_task import DatabaseTask
 
 logger = logging.getLogger(__name__)
 
+# Runs scheduled within this window get their counters recounted periodically
+RUN_STATS_RECONCILE_DAYS = 7
+
+# A claimed message still SENDING after this long lost its worker (crash, or the
+# result write failed after the Graph API call); well above the send timeout
+STALE_SENDING_MINUTES = 10
+
 
 # ---------------------------------------------------------------------------
 # Tasks
@@ -45,9 +54,14 @@ def check_pending_campaigns(self):
 
         logger.info(f"🔍 Checking {len(campaigns)} active campaigns")
 
-        for campaign in campaigns:
-            if _should_campaign_run(db, campaign, now):
-                _schedule_campaign_run(db, campaign, now)
+        last_run_at = _get_last_run_times(db, [c.id for c in campaigns])
+        period_starts = _period_starts(now)
+        due_campaigns = [
+            c for c in campaigns
+            if _should_campaign_run(c, now, last_run_at.get(c.id), period_starts)
+        ]
+        if due_campaigns:
+            _schedule_campaign_runs(db, due_campaigns, now)
 
         logger.info("✅ Campaign check completed")
 
@@ -74,7 +88,8 @@ def execute_campaign_run(self, campaign_run_id: int):
 
         _mark_run_as_running(db, campaign_run)
 
-        contacts = _get_target_contacts(db, campaign)
+        variable_mapping = _parse_variable_mapping(campaign)
+        contacts = _get_target_contacts(db, campaign, variable_mapping)
         if not contacts:
             _complete_run_with_no_contacts(db, campaign_run, campaign)
             return
@@ -84,7 +99,7 @@ def execute_campaign_run(self, campaign_run_id: int):
             _mark_run_as_failed(db, campaign_run)
             return
 
-        messages = _build_messages(db, contacts, campaign, campaign_run, template)
+        messages = _build_messages(db, contacts, campaign, campaign_run, template, variable_mapping)
         _dispatch_messages(messages)
         _complete_run(db, campaign_run, contacts, messages)
 
@@ -105,132 +120,259 @@ def send_campaign_message(self, message_id: int):
         message_id: ID of the message to send
     """
     db = self.db
-    message = None
+    send_attempted = False
 
     try:
-        message = db.query(Message).filter(Message.id == message_id).first()
-
-        if not message:
-            logger.error(f"❌ Message {message_id} not found")
+        # Claim the message with a committed QUEUED -> SENDING transition; a redelivered or
+        # duplicate task finds nothing to claim. No row lock is held across the HTTP call.
+        if not _claim_message(db, message_id):
+            logger.info(f"ℹ️ Message {message_id} not found or already claimed, skipping")
             return
 
-        related = db.query(Campaign, Contact, Template).filter(
-            Campaign.id == message.campaign_id,
-            Contact.id == message.contact_id,
-            Template.id == Campaign.template_id
-        ).first()
+        row = db.query(Message.message_body, Contact, Template).join(
+            Contact, Contact.id == Message.contact_id
+        ).join(
+            Campaign, Campaign.id == Message.campaign_id
+        ).join(
+            Template, Template.id == Campaign.template_id
+        ).filter(Message.id == message_id).first()
 
-        if not related:
+        if not row:
             logger.error(f"❌ Missing data for message {message_id}")
-            message.status = MessageStatus.FAILED
-            message.failure_reason = "Missing campaign, contact, or template data"
-            message.updated_at = now_utc()
-            db.commit()
+            _finish_message(db, message_id, status=MessageStatus.FAILED,
+                            failure_reason="Missing campaign, contact, or template data")
             return
 
-        _, contact, template = related 
+        body_params, contact, template = row
 
         try:
-            jeweller = db.query(Jeweller).filter(Jeweller.id == contact.jeweller_id).first()
+            jeweller = _get_jeweller(db, contact.jeweller_id)
             if not jeweller or not jeweller.phone_number_id or not jeweller.access_token:
                 raise ValueError("WhatsApp credentials not configured for jeweller")
             access_token = decrypt_token(jeweller.access_token)
         except (TokenEncryptionError, ValueError) as e:
             logger.error(f"❌ WhatsApp send failed for message {message_id}: {str(e)}")
-            message.status = MessageStatus.FAILED
-            message.failure_reason = str(e)
-            message.updated_at = now_utc()
-            db.commit()
+            _finish_message(db, message_id, status=MessageStatus.FAILED, failure_reason=str(e))
             return
 
-        result = whatsapp_service.send_template_message_sync(
+        send_kwargs = dict(
             phone_number_id=jeweller.phone_number_id,
             access_token=access_token,
             phone_number=contact.phone_number,
             template_name=template.template_name,
             language_code=(contact.preferred_language or Language.ENGLISH).value,
-            body_params=message.message_body,
+            body_params=body_params,
         )
+        # End the read transaction so no connection is pinned during the Graph API call
+        db.commit()
+
+        send_attempted = True
+        result = whatsapp_service.send_template_message_sync(**send_kwargs)
 
         if result.success:
-            message.status = MessageStatus.SENT
-            message.whatsapp_message_id = result.message_id
-            message.sent_at = now_utc()
-            message.updated_at = now_utc()
-            logger.info(f"✅ Message {message_id} sent to {contact.phone_number}")
+            _finish_message(db, message_id, status=MessageStatus.SENT,
+                            whatsapp_message_id=result.message_id, sent_at=now_utc())
+            logger.info(f"✅ Message {message_id} sent to {send_kwargs['phone_number']}")
         else:
-            message.status = MessageStatus.FAILED
-            message.failure_reason = result.error or "Unknown error"
-            message.updated_at = now_utc()
-            logger.error(f"❌ Message {message_id} failed: {message.failure_reason}")
-
-        db.commit()
+            failure_reason = result.error or "Unknown error"
+            _finish_message(db, message_id, status=MessageStatus.FAILED, failure_reason=failure_reason)
+            logger.error(f"❌ Message {message_id} failed: {failure_reason}")
 
     except Exception as e:
         logger.error(f"❌ Error sending message {message_id}: {str(e)}")
+        db.rollback()
+        if not send_attempted:
+            # Nothing went out yet: hand the claim back so the retry can pick it up
+            _release_message(db, message_id)
         raise self.retry(exc=e, countdown=60, max_retries=3)
 
 
+@celery_app.task(bind=True, base=DatabaseTask, name='app.services.campaign_tasks.reconcile_campaign_run_stats')
+def reconcile_campaign_run_stats(self):
+    """
+    Periodic task: Recount delivered/read/failed for recent campaign runs.
+    Webhooks only apply increments, so this corrects any drift from status
+    changes written elsewhere (e.g. send failures).
+
+    Also fails messages stuck in SENDING, which retries never pick up again.
+    """
+    db = self.db
+
+    try:
+        _fail_stale_sending_messages(db)
+
+        since = now_utc().replace(tzinfo=None) - timedelta(days=RUN_STATS_RECONCILE_DAYS)
+        run_ids = [run_id for (run_id,) in db.query(CampaignRun.id).filter(CampaignRun.scheduled_at >= since)]
+        if not run_ids:
+            return
+
+        counts = {}
+        for run_id, status, count in (
+            db.query(Message.campaign_run_id, Message.status, func.count(Message.id))
+            .filter(Message.campaign_run_id.in_(run_ids))
+            .group_by(Message.campaign_run_id, Message.status)
+        ):
+            counts.setdefault(run_id, {})[status] = count
+
+        db.bulk_update_mappings(CampaignRun, [
+            {
+                "id": run_id,
+                "messages_delivered": counts.get(run_id, {}).get(MessageStatus.DELIVERED, 0),
+                "messages_read": counts.get(run_id, {}).get(MessageStatus.READ, 0),
+                "messages_failed": counts.get(run_id, {}).get(MessageStatus.FAILED, 0),
+            }
+            for run_id in run_ids
+        ])
+        db.commit()
+
+        logger.info(f"✅ Reconciled stats for {len(run_ids)} campaign runs")
+
+    except Exception as e:
+        logger.error(f"❌ Error reconciling campaign run stats: {str(e)}")
+        raise
+
+
+# ---------------------------------------------------------------------------
+# send_campaign_message helpers
+# ---------------------------------------------------------------------------
+# Run once per message, so built as lambda statements: SQLAlchemy caches the
+# statement by the lambda's code location and only re-binds the id each call.
+
+def _claim_message(db, message_id) -> bool:
+    """Move a QUEUED message to SENDING in its own short transaction; False if it was not QUEUED"""
+    claimed = db.execute(
+        update(Message)
+        .where(Message.id == message_id, Message.status == MessageStatus.QUEUED)
+        .values(status=MessageStatus.SENDING)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return claimed == 1
+
+
+def _release_message(db, message_id) -> None:
+    """Return a claimed-but-unsent message to QUEUED (best effort, before a task retry)"""
+    try:
+        db.execute(
+            update(Message)
+            .where(Message.id == message_id, Message.status == MessageStatus.SENDING)
+            .values(status=MessageStatus.QUEUED)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ Could not release claim on message {message_id}: {str(e)}")
+
+
+def _fail_stale_sending_messages(db) -> None:
+    """
+    Move messages claimed longer than STALE_SENDING_MINUTES ago to FAILED.
+
+    Whether the Graph API call went out is unknown, so they are failed rather than
+    re-queued to avoid sending the customer a duplicate. The claim sets updated_at.
+    """
+    cutoff = now_utc().replace(tzinfo=None) - timedelta(minutes=STALE_SENDING_MINUTES)
+    swept = db.execute(
+        update(Message)
+        .where(Message.status == MessageStatus.SENDING, Message.updated_at < cutoff)
+        .values(status=MessageStatus.FAILED, failed_at=now_utc(),
+                failure_reason="Send interrupted; delivery state unknown")
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    if swept:
+        logger.warning(f"⚠️ Failed {swept} messages stuck in SENDING for over {STALE_SENDING_MINUTES} minutes")
+
+
+def _finish_message(db, message_id, **values) -> None:
+    """Write the outcome of a claimed send in one short transaction"""
+    db.execute(
+        update(Message)
+        .where(Message.id == message_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def _get_jeweller(db, jeweller_id):
+    return db.execute(lambda_stmt(
+        lambda: select(Jeweller).where(Jeweller.id == jeweller_id)
+    )).scalar_one_or_none()
+
+
 # ---------------------------------------------------------------------------
 # check_pending_campaigns helpers
 # ---------------------------------------------------------------------------
 
 def _get_active_campaigns(db, now):
-    return db.query(Campaign).filter(
+    """Scheduling only reads a few columns, so load lightweight rows instead of ORM objects"""
+    return db.query(
+        Campaign.id,
+        Campaign.jeweller_id,
+        Campaign.name,
+        Campaign.recurrence_type,
+        Campaign.start_date,
+    ).filter(
         Campaign.status == CampaignStatus.ACTIVE,
         Campaign.start_date <= now.date()
     ).all()
 
 
-def _should_campaign_run(db, campaign, now) -> bool:
-    checkers = {
-        RecurrenceType.ONE_TIME: _should_run_one_time,
-        RecurrenceType.DAILY:    _should_run_daily,
-        RecurrenceType.WEEKLY:   _should_run_weekly,
-        RecurrenceType.MONTHLY:  _should_run_monthly,
-    }
-    checker = checkers.get(campaign.recurrence_type)
-    return checker(db, campaign, now) if checker else False
-
-
-def _has_existing_run(db, campaign_id, since=None) -> bool:
-    query = db.query(CampaignRun).filter(CampaignRun.campaign_id == campaign_id)
-    if since:
-        query = query.filter(CampaignRun.scheduled_at >= since)
-    return query.first() is not None
-
-
-def _should_run_one_time(db, campaign, now) -> bool:
-    return campaign.start_date <= now.date() and not _has_existing_run(db, campaign.id)
+def _get_last_run_times(db, campaign_ids) -> dict:
+    """Latest scheduled_at per campaign, fetched for all candidates in one grouped query"""
+    if not campaign_ids:
+        return {}
+    return dict(
+        db.query(CampaignRun.campaign_id, func.max(CampaignRun.scheduled_at))
+        .filter(CampaignRun.campaign_id.in_(campaign_ids))
+        .group_by(CampaignRun.campaign_id)
+        .all()
+    )
 
 
-def _should_run_daily(db, campaign, now) -> bool:
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    return not _has_existing_run(db, campaign.id, since=today_start)
+def _period_starts(now) -> dict:
+    """Start of the current period per recurrence type, computed once per tick.
 
+    scheduled_at is stored naive UTC, so the boundaries are made naive here
+    rather than on every comparison.
+    """
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+    return {
+        RecurrenceType.DAILY:   today_start,
+        RecurrenceType.WEEKLY:  today_start - timedelta(days=today_start.weekday()),
+        RecurrenceType.MONTHLY: today_start.replace(day=1),
+    }
 
-def _should_run_weekly(db, campaign, now) -> bool:
-    week_start = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
-    return not _has_existing_run(db, campaign.id, since=week_start)
 
+def _should_campaign_run(campaign, now, last_run_at, period_starts) -> bool:
+    if campaign.recurrence_type == RecurrenceType.ONE_TIME:
+        return campaign.start_date <= now.date() and last_run_at is None
 
-def _should_run_monthly(db, campaign, now) -> bool:
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    return not _has_existing_run(db, campaign.id, since=month_start)
+    period_start = period_starts.get(campaign.recurrence_type)
+    if period_start is None:
+        return False
+    return last_run_at is None or last_run_at < period_start
 
 
-def _schedule_campaign_run(db, campaign, now):
-    logger.info(f"📅 Scheduling campaign run for '{campaign.name}' (ID: {campaign.id})")
-    campaign_run = CampaignRun(
-        campaign_id=campaign.id,
-        jeweller_id=campaign.jeweller_id,
-        scheduled_at=now,
-        status="PENDING"
-    )
-    db.add(campaign_run)
+def _schedule_campaign_runs(db, campaigns, now):
+    """Create runs for all due campaigns in one commit, then publish them as one group"""
+    campaign_runs = []
+    for campaign in campaigns:
+        logger.info(f"📅 Scheduling campaign run for '{campaign.name}' (ID: {campaign.id})")
+        campaign_runs.append(CampaignRun(
+            campaign_id=campaign.id,
+            jeweller_id=campaign.jeweller_id,
+            scheduled_at=now,
+            status="PENDING"
+        ))
+    db.add_all(campaign_runs)
+    db.flush()
+    run_ids = [run.id for run in campaign_runs]  # Read before commit expires the objects
     db.commit()
-    db.refresh(campaign_run)
-    execute_campaign_run.delay(campaign_run.id)
+
+    group(execute_campaign_run.s(run_id) for run_id in run_ids).apply_async()
 
 
 # ---------------------------------------------------------------------------
@@ -268,8 +410,16 @@ def _mark_run_as_failed(db, campaign_run):
         db.commit()
 
 
-def _get_target_contacts(db, campaign):
-    query = db.query(Contact).filter(
+def _get_target_contacts(db, campaign, variable_mapping):
+    """Load only the columns the send loop reads, as plain rows rather than ORM objects"""
+    contact_columns = Contact.__table__.columns
+    columns = [Contact.id, Contact.phone_number, Contact.preferred_language]
+    columns += [
+        contact_columns[name]
+        for name in {v for v in variable_mapping.values() if isinstance(v, str)}
+        if name in contact_columns and name not in ('id', 'phone_number', 'preferred_language')
+    ]
+    query = db.query(*columns).filter(
         Contact.jeweller_id == campaign.jeweller_id,
         Contact.is_deleted == False
     )
@@ -296,7 +446,8 @@ def _load_template(db, campaign):
     return template
 
 
-def _resolve_variables(campaign, contact) -> dict:
+def _parse_variable_mapping(campaign) -> dict:
+    """Parse the campaign's variable mapping once per run"""
     if not campaign.variable_mapping:
         return {}
     try:
@@ -305,24 +456,29 @@ def _resolve_variables(campaign, contact) -> dict:
             if isinstance(campaign.variable_mapping, str)
             else campaign.variable_mapping
         )
-        if not isinstance(raw_mapping, dict):
-            return {}
-        return {
-            key: (getattr(contact, value) or "" if isinstance(value, str) and hasattr(contact, value) else str(value))
-            for key, value in raw_mapping.items()
-        }
     except Exception:
         return {}
+    return raw_mapping if isinstance(raw_mapping, dict) else {}
+
+
+def _resolve_variables(variable_mapping, contact) -> dict:
+    # Contacts are Row tuples: match against the selected column keys, since hasattr()
+    # would also accept tuple methods such as "count" or "index"
+    fields = contact._fields
+    return {
+        key: (getattr(contact, value) or "" if isinstance(value, str) and value in fields else str(value))
+        for key, value in variable_mapping.items()
+    }
 
 
-def _build_messages(db, contacts, campaign, campaign_run, template) -> list:
+def _build_messages(db, contacts, campaign, campaign_run, template, variable_mapping) -> list:
     logger.info(f"📋 Found {len(contacts)} contacts to message")
     template_service = TemplateService(db)
     messages = []
 
     for contact in contacts:
         language = contact.preferred_language or Language.ENGLISH
-        variables = _resolve_variables(campaign, contact)
+        variables = _resolve_variables(variable_mapping, contact)
         body = template_service.render_template(campaign.template_id, language, variables) or ""
 
         message = Message(
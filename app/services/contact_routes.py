@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, UploadFile, File, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, Integer
+from sqlalchemy import func, insert, Integer
 from typing import List, Optional
+from pydantic import TypeAdapter
 from app.database import get_db
 from app.core.dependencies import get_current_jeweller
 from app.core.datetime_utils import now_utc
@@ -26,6 +27,13 @@ from datetime import datetime
 
 router = APIRouter(prefix="/contacts", tags=["Contacts"])
 
+# Built once; validates a page of ORM rows in a single pydantic-core call
+_CONTACT_LIST_ADAPTER = TypeAdapter(List[ContactResponse])
+
+# Accepted values for bulk-upload enum columns
+_SEGMENT_VALUES = frozenset(s.value for s in SegmentType)
+_LANGUAGE_VALUES = frozenset(lang.value for lang in Language)
+
 
 # ============ Dashboard-Compatible Endpoints ============
 
@@ -130,7 +138,7 @@ async def bulk_upload_dashboard(
         if file.filename.endswith('.csv'):
             df = pd.read_csv(io.BytesIO(contents))
         else:
-            df = pd.read_excel(io.BytesIO(contents))
+            df = pd.read_excel(io.BytesIO(contents), engine="calamine")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -308,7 +316,7 @@ async def upload_contacts(
         if file.filename.endswith('.csv'):
             df = pd.read_csv(io.BytesIO(contents))
         else:
-            df = pd.read_excel(io.BytesIO(contents))
+            df = pd.read_excel(io.BytesIO(contents), engine="calamine")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -325,66 +333,83 @@ async def upload_contacts(
         )
     
     total_rows = len(df)
-    imported = 0
-    updated = 0
-    failed = 0
-    failure_details = []
+    
+    # Normalize and validate whole columns at once instead of row by row
+    phone_numbers = df['phone_number'].astype(str).str.strip()
+    segments = df['segment'].astype(str).str.strip().str.upper()
+    languages = df['preferred_language'].astype(str).str.strip().str.lower()
+    
+    invalid_language = ~languages.isin(_LANGUAGE_VALUES)
+    invalid_segment = ~segments.isin(_SEGMENT_VALUES)
+    reasons = pd.Series(None, index=df.index, dtype=object)
+    reasons[invalid_language] = "Invalid language: " + languages[invalid_language]
+    reasons[invalid_segment] = "Invalid segment: " + segments[invalid_segment]  # Segment error wins
+    valid = reasons.isna()
+    
+    failure_details = [
+        {
+            "row": idx + 2,  # Excel row number (1-indexed + header)
+            "phone": phone,
+            "reason": reason,
+        }
+        for idx, phone, reason in zip(df.index[~valid], phone_numbers[~valid], reasons[~valid])
+    ]
+    failed = len(failure_details)
+    
+    # Optional columns: missing column or empty cell -> None
+    optional = {
+        col: (
+            df[col].astype(object).where(df[col].notna(), None)
+            if col in df.columns else pd.Series(None, index=df.index, dtype=object)
+        )[valid]
+        for col in ('name', 'customer_id', 'notes', 'tags')
+    }
     
     # Batch-fetch all existing contacts for this jeweller to avoid N queries
-    all_phone_numbers = [str(row['phone_number']).strip() for _, row in df.iterrows()]
     existing_contacts = db.query(Contact).filter(
         Contact.jeweller_id == current_jeweller.id,
-        Contact.phone_number.in_(all_phone_numbers)
+        Contact.phone_number.in_(phone_numbers[valid].unique().tolist())
     ).all()
     existing_map = {c.phone_number: c for c in existing_contacts}
     
-    for idx, row in df.iterrows():
-        try:
-            phone_number = str(row['phone_number']).strip()
-            segment = row['segment'].upper()
-            language = row['preferred_language'].lower()
-            
-            # Validate enum values
-            if segment not in [s.value for s in SegmentType]:
-                raise ValueError(f"Invalid segment: {segment}")
-            if language not in [l.value for l in Language]:
-                raise ValueError(f"Invalid language: {language}")
-            
-            # Look up from pre-fetched map instead of individual query
-            existing = existing_map.get(phone_number)
-            
-            if existing:
-                # Update existing contact
-                existing.segment = SegmentType(segment)
-                existing.preferred_language = Language(language)
-                existing.name = row.get('name')
-                existing.customer_id = row.get('customer_id')
-                existing.notes = row.get('notes')
-                existing.tags = row.get('tags')
-                existing.updated_at = now_utc()
-                updated += 1
-            else:
-                # Create new contact
-                new_contact = Contact(
-                    jeweller_id=current_jeweller.id,
-                    phone_number=phone_number,
-                    segment=SegmentType(segment),
-                    preferred_language=Language(language),
-                    name=row.get('name'),
-                    customer_id=row.get('customer_id'),
-                    notes=row.get('notes'),
-                    tags=row.get('tags')
-                )
-                db.add(new_contact)
-                imported += 1
+    imported = 0
+    updated = 0
+    new_rows = {}  # phone -> insert mapping; later duplicates in the file win
+    for phone_number, segment, language, name, customer_id, notes, tags in zip(
+        phone_numbers[valid], segments[valid], languages[valid],
+        optional['name'], optional['customer_id'], optional['notes'], optional['tags'],
+    ):
+        existing = existing_map.get(phone_number)
+        if existing:
+            # Update existing contact
+            existing.segment = SegmentType(segment)
+            existing.preferred_language = Language(language)
+            existing.name = name
+            existing.customer_id = customer_id
+            existing.notes = notes
+            existing.tags = tags
+            existing.updated_at = now_utc()
+            updated += 1
+            continue
         
-        except Exception as e:
-            failed += 1
-            failure_details.append({
-                "row": idx + 2,  # Excel row number (1-indexed + header)
-                "phone": str(row.get('phone_number', 'N/A')),
-                "reason": str(e)
-            })
+        if phone_number in new_rows:
+            updated += 1
+        else:
+            imported += 1
+        new_rows[phone_number] = {
+            "jeweller_id": current_jeweller.id,
+            "phone_number": phone_number,
+            "segment": SegmentType(segment),
+            "preferred_language": Language(language),
+            "name": name,
+            "customer_id": customer_id,
+            "notes": notes,
+            "tags": tags,
+        }
+    
+    # Create new contacts in a single executemany INSERT
+    if new_rows:
+        db.execute(insert(Contact), list(new_rows.values()))
     
     db.commit()
     
@@ -468,13 +493,15 @@ def list_contacts(
     
     total_pages = (total + page_size - 1) // page_size
     
-    return ContactListResponse(
-        contacts=contacts,
+    result = ContactListResponse.model_construct(
+        contacts=_CONTACT_LIST_ADAPTER.validate_python(contacts, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages
     )
+    # Serialize straight to JSON bytes in pydantic-core, skipping jsonable_encoder
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get("/stats", response_model=List[ContactSegmentStats])
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Dict, Optional
+from pydantic import TypeAdapter
 from app.database import get_db
 from app.core.dependencies import get_current_admin, get_current_jeweller, get_current_user
-from app.core.datetime_utils import now_utc, now_utc
+from app.core.cache import cache_get, cache_set, cache_delete_pattern
 from app.models.jeweller import Jeweller
 from app.models.template import Template, TemplateTranslation
 from app.schemas.template import (
@@ -19,9 +22,52 @@ from app.services.template_service import (
     extract_variable_names_from_text,
 )
 from datetime import datetime
+import hashlib
+import re
 
 router = APIRouter(prefix="/templates", tags=["Templates"])
 
+# Jeweller-facing template list cache (invalidated by every admin mutation below)
+ACTIVE_TEMPLATES_CACHE_PREFIX = "templates:active:"
+ACTIVE_TEMPLATES_CACHE_TTL = 300
+
+_NUMERIC_VAR_RE = re.compile(r'\{\{\d+\}\}')
+
+
+def _invalidate_active_templates_cache() -> None:
+    cache_delete_pattern(f"{ACTIVE_TEMPLATES_CACHE_PREFIX}*")
+
+
+# Duplicate-key error codes: MySQL ER_DUP_ENTRY, PostgreSQL unique_violation
+_MYSQL_DUP_ENTRY = 1062
+_PG_UNIQUE_VIOLATION = "23505"
+
+
+def _is_duplicate_template_name(error: IntegrityError) -> bool:
+    """True only if the IntegrityError is the templates.template_name unique key"""
+    orig = error.orig
+    message = str(orig)
+    args = getattr(orig, "args", ())
+    duplicate = (
+        (bool(args) and args[0] == _MYSQL_DUP_ENTRY)
+        or getattr(orig, "pgcode", None) == _PG_UNIQUE_VIOLATION
+        or "UNIQUE constraint failed" in message  # SQLite
+    )
+    return duplicate and "template_name" in message
+
+
+# Built once; validates a whole list of ORM rows in a single pydantic-core call
+_TEMPLATE_LIST_ADAPTER = TypeAdapter(List[TemplateResponse])
+
+
+def _template_list_json(templates: List[Template], total: Optional[int] = None) -> str:
+    """Serialize ORM templates as a TemplateListResponse JSON body without per-item model construction"""
+    items = _TEMPLATE_LIST_ADAPTER.validate_python(templates, from_attributes=True)
+    return TemplateListResponse.model_construct(
+        templates=items,
+        total=len(items) if total is None else total,
+    ).model_dump_json()
+
 
 # ============ Jeweller Endpoints (Read-only) ============
 
@@ -45,18 +91,24 @@ def list_templates_for_jeweller(
         .join(Template.translations)
         .filter(TemplateTranslation.approval_status == "APPROVED")
         .distinct()
-        .options(joinedload(Template.translations))
+        .options(selectinload(Template.translations))
     )
     
+    # Same result for every jeweller, so cache it per campaign type
+    cache_key = f"{ACTIVE_TEMPLATES_CACHE_PREFIX}{campaign_type.value if campaign_type else 'all'}"
+    cached = cache_get(cache_key)
+    if cached:
+        return Response(content=cached, media_type="application/json")
+    
     if campaign_type:
         query = query.filter(Template.campaign_type == campaign_type)
     
     templates = query.all()
     
-    return TemplateListResponse(
-        templates=templates,
-        total=len(templates)
-    )
+    payload = _template_list_json(templates)
+    cache_set(cache_key, payload, ACTIVE_TEMPLATES_CACHE_TTL)
+    
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{template_id}/preview", response_model=TemplatePreviewResponse)
@@ -90,37 +142,60 @@ def preview_template_for_jeweller(
 @router.get("/{template_id}", response_model=TemplateResponse)
 def get_template_for_jeweller(
     template_id: int,
+    request: Request,
     current_jeweller: Jeweller = Depends(get_current_jeweller),
     db: Session = Depends(get_db)
 ):
-    """Get template details"""
-    template = db.query(Template).filter(
+    """Get template details (supports If-None-Match conditional GET)"""
+    template = db.query(Template).options(
+        selectinload(Template.translations)
+    ).filter(
         Template.id == template_id,
         Template.is_active == True
     ).first()
-    
+
     if not template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Template not found"
         )
-    
-    return template
+
+    # Tag the serialized body itself: updated_at has whole-second resolution on MySQL,
+    # so two edits within a second would otherwise share a tag and serve stale content
+    body = TemplateResponse.model_validate(template, from_attributes=True).model_dump_json().encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    return Response(content=body, media_type="application/json", headers=cache_headers)
 
 
 # ============ Admin Endpoints (Full CRUD) ============
 
 @router.get("/admin/all", response_model=TemplateListResponse)
 def list_all_templates_admin(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(100, ge=1, le=500),
+    after_id: Optional[int] = Query(None, ge=0, description="Keyset cursor: return templates with id > after_id"),
     current_admin = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
-    """Admin: List all templates including inactive"""
-    templates = db.query(Template).all()
-    return TemplateListResponse(
-        templates=templates,
-        total=len(templates)
-    )
+    """Admin: List all templates including inactive (paginated by page or after_id cursor)"""
+    total = db.scalar(select(func.count(Template.id)))
+    
+    query = db.query(Template).options(
+        selectinload(Template.translations)
+    ).order_by(Template.id)
+    
+    if after_id is not None:
+        query = query.filter(Template.id > after_id)
+    else:
+        query = query.offset((page - 1) * page_size)
+    
+    templates = query.limit(page_size).all()
+    return Response(content=_template_list_json(templates, total=total), media_type="application/json")
 
 
 @router.get("/admin/approved", response_model=TemplateListResponse)
@@ -139,17 +214,14 @@ def list_approved_templates_admin(
         .join(Template.translations)
         .filter(TemplateTranslation.approval_status == "APPROVED")
         .distinct()
-        .options(joinedload(Template.translations))
+        .options(selectinload(Template.translations))
     )
 
     if campaign_type:
         query = query.filter(Template.campaign_type == campaign_type)
 
     templates = query.all()
-    return TemplateListResponse(
-        templates=templates,
-        total=len(templates)
-    )
+    return Response(content=_template_list_json(templates), media_type="application/json")
 
 
 @router.post("/admin/", response_model=TemplateResponse, status_code=status.HTTP_201_CREATED)
@@ -159,20 +231,7 @@ def create_template_admin(
     db: Session = Depends(get_db)
 ):
     """Admin: Create new WhatsApp template"""
-    # Check if template name exists
-    existing = db.query(Template).filter(
-        Template.template_name == request.template_name
-    ).first()
-    
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Template with this name already exists"
-        )
-    
-    # Create template
-    variable_names_json = ",".join(request.variable_names) if request.variable_names else None
-    
+    # Create template (template_name is UNIQUE, so duplicates fail on insert)
     new_template = Template(
         template_name=request.template_name,
         display_name=request.display_name,
@@ -181,23 +240,32 @@ def create_template_admin(
         description=request.description,
         category=request.category,
         variable_count=request.variable_count,
-        variable_names=variable_names_json,
+        variable_names=request.variable_names or None,
         is_active=True
     )
     db.add(new_template)
-    db.flush()  # Get template.id
-    
-    # Create translations
-    for trans in request.translations:
-        translation = TemplateTranslation(
-            template_id=new_template.id,
-            **trans.model_dump()
+    try:
+        db.flush()  # Get template.id
+    except IntegrityError as e:
+        db.rollback()
+        if not _is_duplicate_template_name(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Template with this name already exists"
         )
-        db.add(translation)
     
+    # Create translations in a single executemany INSERT
+    if request.translations:
+        db.execute(insert(TemplateTranslation), [
+            {"template_id": new_template.id, **trans.model_dump()}
+            for trans in request.translations
+        ])
+
+    # No refresh needed: commit expires new_template, so translations load on serialization
     db.commit()
-    db.refresh(new_template)
-    
+    _invalidate_active_templates_cache()
+
     return new_template
 
 
@@ -221,9 +289,9 @@ def update_template_admin(
     for field, value in update_data.items():
         setattr(template, field, value)
     
-    template.updated_at = now_utc()
     db.commit()
     db.refresh(template)
+    _invalidate_active_templates_cache()
     
     return template
 
@@ -245,6 +313,7 @@ def delete_template_admin(
     
     db.delete(template)  # cascade="all, delete-orphan" removes translations
     db.commit()
+    _invalidate_active_templates_cache()
     
     return None
 
@@ -263,6 +332,7 @@ async def sync_template_to_whatsapp(
     """
     template_service = TemplateService(db)
     result = await template_service.create_template_in_whatsapp(template_id)
+    _invalidate_active_templates_cache()
     
     if not result.get("success"):
         raise HTTPException(
@@ -284,6 +354,7 @@ async def get_template_whatsapp_status(
     """
     template_service = TemplateService(db)
     result = await template_service.get_template_status(template_id)
+    _invalidate_active_templates_cache()  # Approval status may have changed
     
     if not result.get("success"):
         raise HTTPException(
@@ -305,6 +376,7 @@ async def sync_templates_from_whatsapp(
     """
     template_service = TemplateService(db)
     result = await template_service.sync_templates_from_whatsapp()
+    _invalidate_active_templates_cache()
     
     return result
 
@@ -320,6 +392,7 @@ async def delete_template_from_whatsapp(
     """
     template_service = TemplateService(db)
     result = await template_service.delete_template_from_whatsapp(template_id)
+    _invalidate_active_templates_cache()
     
     if not result.get("success"):
         raise HTTPException(
@@ -395,12 +468,9 @@ def _build_preview_response(
         approved_only: If True, only include APPROVED translations.
         jeweller_name: Optional jeweller business name for personalised previews.
     """
-    import re
 
     # DB-level variable names (may be empty for older templates)
-    all_var_names = [
-        v.strip() for v in (template.variable_names or "").split(",") if v.strip()
-    ]
+    all_var_names = [v for v in (template.variable_names or []) if v]
     has_db_vars = bool(all_var_names)
 
     translation_previews = []
@@ -412,7 +482,7 @@ def _build_preview_response(
 
         if has_db_vars:
             # Split DB variable names into header/body portions
-            header_numeric_count = len(re.findall(r'\{\{\d+\}\}', trans.header_text or ""))
+            header_numeric_count = len(_NUMERIC_VAR_RE.findall(trans.header_text or ""))
             header_var_names = all_var_names[:header_numeric_count]
             body_var_names = all_var_names[header_numeric_count:]
             dummy_values = generate_dummy_values(
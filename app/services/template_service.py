@@ -2,16 +2,19 @@
 Template Management Service
 Synchronizes WhatsApp templates with local database
 """
+import asyncio
 import logging
 import re
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.orm import Session, selectinload
 
+from app.config import settings
 from app.models.template import Template, TemplateTranslation
 from app.services.whatsapp_service import whatsapp_service, TemplateResult
-from app.utils.enums import CampaignType, Language, SegmentType
+from app.utils.enums import CampaignType, Language, MessageStatus, SegmentType
 
 # Map WhatsApp language codes to local Language enum values
 _LANGUAGE_ENUM_VALUES = {lang.value for lang in Language}
@@ -31,6 +34,39 @@ def _map_wa_language(wa_lang: str) -> Optional[Language]:
 
 logger = logging.getLogger(__name__)
 
+# Buffered message status changes are written in batches of this size
+STATUS_UPDATE_BATCH_SIZE = 500
+
+# WhatsApp status -> (internal status, lifecycle timestamp column)
+WHATSAPP_STATUS_MAP = {
+    "sent": (MessageStatus.SENT, "sent_at"),
+    "delivered": (MessageStatus.DELIVERED, "delivered_at"),
+    "read": (MessageStatus.READ, "read_at"),
+    "failed": (MessageStatus.FAILED, "failed_at"),
+}
+
+# Lifecycle timestamp columns written by status callbacks
+LIFECYCLE_COLUMNS = ("sent_at", "delivered_at", "read_at", "failed_at")
+
+# Forward order of delivery statuses; READ and FAILED are terminal
+STATUS_RANK = {
+    MessageStatus.SENT: 1,
+    MessageStatus.DELIVERED: 2,
+    MessageStatus.READ: 3,
+    MessageStatus.FAILED: 3,
+}
+
+# Internal status -> campaign_runs counter it is tallied in
+RUN_STAT_COLUMNS = {
+    MessageStatus.DELIVERED: "messages_delivered",
+    MessageStatus.READ: "messages_read",
+    MessageStatus.FAILED: "messages_failed",
+}
+
+
+# {{name}} / {{1}} placeholder in template text, compiled once for the hot render path
+_VAR_RE = re.compile(r'\{\{(\w+)\}\}')
+
 
 # ============ Dummy value mapping for template preview ============
 
@@ -88,7 +124,7 @@ def extract_variable_names_from_text(text: Optional[str]) -> List[str]:
     # Find all {{...}} patterns and deduplicate preserving order
     seen: set = set()
     result: List[str] = []
-    for m in re.findall(r'\{\{(\w+)\}\}', text):
+    for m in _VAR_RE.findall(text):
         if m not in seen:
             seen.add(m)
             result.append(m)
@@ -96,20 +132,20 @@ def extract_variable_names_from_text(text: Optional[str]) -> List[str]:
 
 
 def generate_dummy_values(
-    variable_names_csv: Optional[str],
+    variable_names: Optional[List[str]],
     jeweller_name: Optional[str] = None,
 ) -> Dict[str, str]:
     """
     Generate dummy values for template variables based on variable names.
 
     Args:
-        variable_names_csv: Comma-separated variable names (e.g. "customer_name,amount")
+        variable_names: Ordered variable names (e.g. ["customer_name", "amount"])
         jeweller_name: Optional jeweller business name to use for jeweller-related variables.
 
     Returns:
         Dict mapping each variable name to a human-readable dummy value.
     """
-    if not variable_names_csv:
+    if not variable_names:
         return {}
 
     # Variables that should show the jeweller's actual business name
@@ -119,8 +155,7 @@ def generate_dummy_values(
     }
 
     result: Dict[str, str] = {}
-    for var_name in variable_names_csv.split(","):
-        var_name = var_name.strip()
+    for var_name in variable_names:
         if not var_name:
             continue
         # Use actual jeweller name when available for jeweller-related variables
@@ -205,25 +240,42 @@ def render_text_with_variables(
     if text is None:
         return None
 
-    rendered = text
-    
-    # First, try to replace named placeholders directly
-    # This handles templates like "Hi {{customer}}, your amount is {{amount}}"
-    for var_name, value in values.items():
-        named_placeholder = f"{{{{{var_name}}}}}"
-        # Case-insensitive matching for better UX
-        if named_placeholder in rendered:
-            rendered = rendered.replace(named_placeholder, value)
-    
-    # Then, handle numeric placeholders with positional mapping
-    # This handles templates like "Hi {{1}}, your amount is {{2}}"
-    for idx, var_name in enumerate(variable_names, 1):
-        numeric_placeholder = f"{{{{{idx}}}}}"  # {{1}}, {{2}}, etc.
-        if numeric_placeholder in rendered:
-            value = values.get(var_name.strip(), "")
-            rendered = rendered.replace(numeric_placeholder, value)
-    
-    return rendered
+    # Single pass over the text; substituted values are never re-scanned
+    return _VAR_RE.sub(
+        lambda m: _resolve_placeholder(m.group(1), variable_names, values), text
+    )
+
+
+def _resolve_placeholder(name: str, variable_names: List[str], values: Dict[str, str]) -> str:
+    """Value for one {{name}} placeholder; unknown placeholders are kept as-is"""
+    # Named placeholders like "Hi {{customer}}, your amount is {{amount}}"
+    if name in values:
+        return values[name]
+    # Numeric placeholders like "Hi {{1}}, your amount is {{2}}" map positionally
+    if name.isdigit() and 1 <= int(name) <= len(variable_names):
+        return values.get(variable_names[int(name) - 1].strip(), "")
+    return f"{{{{{name}}}}}"
+
+
+def compile_text_format(text: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Turn template text into a str.format string plus its placeholder names.
+
+    "Hi {{customer}}, due {{2}}" -> ("Hi {0}, due {1}", ("customer", "2")).
+    Literal braces are escaped, so rendering is a single C-level
+    fmt.format(*resolved_values) call with no regex work per message.
+    """
+    parts = _VAR_RE.split(text)  # literal, name, literal, name, ..., literal
+    names: List[str] = []
+    fmt = []
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            fmt.append(part.replace("{", "{{").replace("}", "}}"))
+        else:
+            if part not in names:
+                names.append(part)
+            fmt.append(f"{{{names.index(part)}}}")
+    return "".join(fmt), tuple(names)
 
 
 class TemplateService:
@@ -234,6 +286,15 @@ class TemplateService:
     
     def __init__(self, db: Session):
         self.db = db
+        # (template_id, language) -> (translation, variable_names, body_format); lives as long as
+        # the service, i.e. one request or one campaign run
+        self._translation_cache: Dict[Tuple[int, Language], Optional[tuple]] = {}
+    
+    def _get_template_with_translations(self, template_id: int) -> Optional[Template]:
+        """Load a template with its translations in one round-trip (every caller iterates them)"""
+        return self.db.query(Template).options(
+            selectinload(Template.translations)
+        ).filter(Template.id == template_id).first()
     
     async def sync_templates_from_whatsapp(self) -> Dict[str, Any]:
         """
@@ -249,7 +310,7 @@ class TemplateService:
         
         try:
             # Get templates from WhatsApp
-            wa_templates = await whatsapp_service.get_templates()
+            wa_templates = await whatsapp_service.get_templates(refresh=True)
             
             if not wa_templates:
                 logger.warning("No templates retrieved from WhatsApp")
@@ -261,10 +322,8 @@ class TemplateService:
                 }
             
             # Wipe all existing templates (cascade deletes translations)
-            old_count = self.db.query(Template).count()
             self.db.query(TemplateTranslation).delete()
-            self.db.query(Template).delete()
-            self.db.flush()
+            old_count = self.db.query(Template).delete()
             logger.info(f"Cleared {old_count} existing templates before sync")
 
             for wa_template in wa_templates:
@@ -305,7 +364,6 @@ class TemplateService:
                             all_var_names.append(var_name)
                     
                     variable_count = len(all_var_names)
-                    variable_names_csv = ",".join(all_var_names) if all_var_names else None
 
                     display_name = template_name.replace("_", " ").title()
 
@@ -315,22 +373,20 @@ class TemplateService:
                         campaign_type=campaign_type,
                         category=wa_category,
                         variable_count=variable_count,
-                        variable_names=variable_names_csv,
+                        variable_names=all_var_names or None,
                         is_active=True,
+                        # Attached via the relationship so no flush is needed for template_id;
+                        # all rows go out together at commit
+                        translations=[TemplateTranslation(
+                            language=local_lang,
+                            body_text=body_text or template_name,
+                            header_text=header_text,
+                            footer_text=footer_text,
+                            whatsapp_template_id=wa_id,
+                            approval_status=wa_status,
+                        )],
                     )
                     self.db.add(new_template)
-                    self.db.flush()
-
-                    new_trans = TemplateTranslation(
-                        template_id=new_template.id,
-                        language=local_lang,
-                        body_text=body_text or template_name,
-                        header_text=header_text,
-                        footer_text=footer_text,
-                        whatsapp_template_id=wa_id,
-                        approval_status=wa_status,
-                    )
-                    self.db.add(new_trans)
                     created_count += 1
                     logger.info(f"Created template {template_name} from WhatsApp ({local_lang.value}, {wa_status})")
                     
@@ -339,7 +395,7 @@ class TemplateService:
                     errors.append({"template": template_name, "error": str(e)})
                     self.db.rollback()
 
-            self.db.commit()
+            await asyncio.to_thread(self.db.commit)
             
             return {
                 "success": True,
@@ -404,7 +460,7 @@ class TemplateService:
         Returns:
             Dict with creation results
         """
-        template = self.db.query(Template).filter(Template.id == template_id).first()
+        template = self._get_template_with_translations(template_id)
         
         if not template:
             return {
@@ -429,7 +485,6 @@ class TemplateService:
                 # Update local record with WhatsApp template ID
                 translation.whatsapp_template_id = result.template_id
                 translation.approval_status = result.status or "PENDING"
-                translation.updated_at = datetime.utcnow()
                 
                 results.append({
                     "language": translation.language.value,
@@ -444,7 +499,7 @@ class TemplateService:
                     "error": result.error,
                 })
         
-        self.db.commit()
+        await asyncio.to_thread(self.db.commit)
         
         success_count = sum(1 for r in results if r.get("success"))
         
@@ -480,13 +535,14 @@ class TemplateService:
         result = await whatsapp_service.delete_template(template.template_name)
         
         if result.success:
-            # Clear WhatsApp IDs from translations
-            for translation in template.translations:
-                translation.whatsapp_template_id = None
-                translation.approval_status = "DELETED"
-                translation.updated_at = datetime.utcnow()
-            
-            self.db.commit()
+            # Clear WhatsApp IDs from all translations in one statement
+            self.db.execute(
+                update(TemplateTranslation)
+                .where(TemplateTranslation.template_id == template.id)
+                .values(whatsapp_template_id=None, approval_status="DELETED")
+                .execution_options(synchronize_session=False)
+            )
+            await asyncio.to_thread(self.db.commit)
         
         return {
             "success": result.success,
@@ -507,7 +563,7 @@ class TemplateService:
         Returns:
             Dict with template status information
         """
-        template = self.db.query(Template).filter(Template.id == template_id).first()
+        template = self._get_template_with_translations(template_id)
         
         if not template:
             return {
@@ -520,12 +576,12 @@ class TemplateService:
         
         if wa_template:
             # Update local status
-            for translation in template.translations:
-                if translation.language.value == wa_template.get("language"):
-                    translation.approval_status = wa_template.get("status", "PENDING")
-                    translation.updated_at = datetime.utcnow()
+            by_lang = {t.language.value: t for t in template.translations}
+            translation = by_lang.get(wa_template.get("language"))
+            if translation:
+                translation.approval_status = wa_template.get("status", "PENDING")
             
-            self.db.commit()
+            await asyncio.to_thread(self.db.commit)
             
             return {
                 "success": True,
@@ -564,20 +620,14 @@ class TemplateService:
         if campaign_type:
             query = query.filter(Template.campaign_type == campaign_type)
         
-        templates = query.all()
-        
-        # Filter by approved translations if language specified
+        # Filter by approved translations in SQL (EXISTS, so no duplicate rows)
         if language:
-            approved_templates = []
-            for template in templates:
-                for translation in template.translations:
-                    if (translation.language == language and 
-                        translation.approval_status == "APPROVED"):
-                        approved_templates.append(template)
-                        break
-            return approved_templates
-        
-        return templates
+            query = query.filter(Template.translations.any(
+                (TemplateTranslation.language == language) &
+                (TemplateTranslation.approval_status == "APPROVED")
+            ))
+        
+        return query.all()
     
     def render_template(
         self,
@@ -596,34 +646,114 @@ class TemplateService:
         Returns:
             Rendered template body text or None if not found
         """
-        template = self.db.query(Template).filter(Template.id == template_id).first()
-        
-        if not template:
+        cached = self._get_translation(template_id, language)
+        if not cached:
             return None
+        _, variable_names, (body_format, names) = cached
         
-        # Find the translation for the language
-        translation = None
-        for trans in template.translations:
-            if trans.language == language:
-                translation = trans
-                break
+        # Placeholders were compiled once per translation; this is one format() call
+        return body_format.format(
+            *(_resolve_placeholder(name, variable_names, variables) for name in names)
+        )
+    
+    def _get_translation(self, template_id: int, language: Language) -> Optional[tuple]:
+        """
+        Look up a template's translation for a language, querying once per key
         
-        if not translation:
-            return None
+        Campaign runs render the same template for every contact, so repeat calls
+        are answered from the per-service cache.
         
-        # Get variable names from template
-        variable_names = []
-        if template.variable_names:
-            variable_names = [name.strip() for name in template.variable_names.split(",")]
+        Returns:
+            (translation, variable_names, (body_format, placeholder_names)) or None
+            if template/translation is missing
+        """
+        key = (template_id, language)
+        if key in self._translation_cache:
+            return self._translation_cache[key]
         
-        # Render the template using the enhanced render function
-        body_text = render_text_with_variables(
-            text=translation.body_text,
-            variable_names=variable_names,
-            values=variables
-        )
+        template = self._get_template_with_translations(template_id)
+        if template:
+            # One load answers every language of this template
+            variable_names = template.variable_names or []
+            for trans in template.translations:
+                self._translation_cache[(template_id, trans.language)] = (
+                    trans, variable_names, compile_text_format(trans.body_text or "")
+                )
         
-        return body_text
+        return self._translation_cache.setdefault(key, None)
+
+
+def _is_forward_transition(current: MessageStatus, new: MessageStatus) -> bool:
+    """True if moving from current to new never steps back in the delivery lifecycle"""
+    return current == new or STATUS_RANK.get(new, 0) > STATUS_RANK.get(current, 0)
+
+
+def _status_timestamp(raw: Any, received_at: datetime) -> datetime:
+    """Status time as naive UTC: WhatsApp sends epoch seconds, internal callers a datetime"""
+    if isinstance(raw, datetime):
+        return raw
+    try:
+        return datetime.utcfromtimestamp(int(raw)) if raw else received_at
+    except (ValueError, TypeError, OverflowError):
+        return received_at
+
+
+def _collapse_status_updates(status_updates: List[Dict[str, Any]], received_at: datetime) -> Dict[str, Dict[str, Any]]:
+    """
+    Reduce a batch of WhatsApp status objects to one transition per message.
+    
+    Callbacks for the same message may arrive in any order within a batch, so the
+    furthest status in the lifecycle wins (later timestamp breaks ties) rather than
+    whichever appears last. Every lifecycle timestamp seen is kept.
+    
+    Returns:
+        {whatsapp_message_id: {"status", "timestamp", "timestamps", "reason"}}
+    """
+    transitions: Dict[str, Dict[str, Any]] = {}
+    for status_update in status_updates:
+        whatsapp_message_id = status_update.get("id")
+        if not whatsapp_message_id:
+            continue
+        
+        status_value = status_update.get("status")
+        mapped = WHATSAPP_STATUS_MAP.get(status_value)
+        if not mapped:
+            logger.info(f"Ignoring unknown WhatsApp status '{status_value}' for {whatsapp_message_id}")
+            continue
+        internal_status, ts_column = mapped
+        timestamp = _status_timestamp(status_update.get("timestamp"), received_at)
+        
+        failure_reason = None
+        if status_value == "failed":
+            errors = status_update.get("errors", [])
+            if errors:
+                failure_reason = errors[0].get("message", "Unknown error")
+        
+        transition = transitions.get(whatsapp_message_id)
+        if transition is None:
+            transitions[whatsapp_message_id] = {
+                "status": internal_status,
+                "timestamp": timestamp,
+                "timestamps": {ts_column: timestamp},
+                "reason": failure_reason,
+            }
+            continue
+        
+        timestamps = transition["timestamps"]
+        if ts_column not in timestamps or timestamp > timestamps[ts_column]:
+            timestamps[ts_column] = timestamp
+        
+        current = transition["status"]
+        if current == internal_status:
+            wins = timestamp >= transition["timestamp"]
+        else:
+            wins = _is_forward_transition(current, internal_status)
+        if wins:
+            transition["status"] = internal_status
+            transition["timestamp"] = timestamp
+            transition["reason"] = failure_reason or transition["reason"]
+    
+    return transitions
 
 
 class MessageService:
@@ -643,6 +773,8 @@ class MessageService:
         language_code: str,
         params: List[str],
         message_id: Optional[int] = None,
+        update_buffer: Optional[List[Dict[str, Any]]] = None,
+        message=None,
     ) -> Dict[str, Any]:
         """
         Send a single campaign message
@@ -653,6 +785,9 @@ class MessageService:
             language_code: Language code for the template
             params: List of template parameters
             message_id: Optional local message ID for tracking
+            update_buffer: If given, the message status change is appended here
+                for a later bulk write instead of being committed immediately
+            message: Already-loaded Message row (skips the lookup query)
             
         Returns:
             Dict with send result
@@ -667,9 +802,17 @@ class MessageService:
             body_params=params,
         )
         
+        if message is not None:
+            message_id = message.id
+        
+        # Buffer the status change for the caller's bulk write
+        if message_id and update_buffer is not None:
+            update_buffer.append(self._status_mapping(message_id, result))
+        
         # Update message record if provided
-        if message_id:
-            message = self.db.query(Message).filter(Message.id == message_id).first()
+        elif message_id:
+            if message is None:
+                message = self.db.query(Message).filter(Message.id == message_id).first()
             if message:
                 if result.success:
                     message.whatsapp_message_id = result.message_id
@@ -681,8 +824,7 @@ class MessageService:
                     message.failure_reason = result.error
                     message.retry_count += 1
                 
-                message.updated_at = datetime.utcnow()
-                self.db.commit()
+                await asyncio.to_thread(self.db.commit)
         
         return {
             "success": result.success,
@@ -691,6 +833,49 @@ class MessageService:
             "error": result.error,
         }
     
+    @staticmethod
+    def _status_mapping(message_id: int, result) -> Dict[str, Any]:
+        """Build the bulk_update_mappings row for a send result"""
+        from app.utils.enums import MessageStatus
+        
+        now = datetime.utcnow()
+        if result.success:
+            return {
+                "id": message_id,
+                "whatsapp_message_id": result.message_id,
+                "status": MessageStatus.SENT,
+                "sent_at": now,
+            }
+        return {
+            "id": message_id,
+            "status": MessageStatus.FAILED,
+            "failed_at": now,
+            "failure_reason": result.error,
+        }
+    
+    def _flush_status_updates(self, update_buffer: List[Dict[str, Any]]) -> None:
+        """Write buffered message status changes in bulk and commit"""
+        from app.models.message import Message
+        from app.utils.enums import MessageStatus
+        
+        if not update_buffer:
+            return
+        
+        self.db.bulk_update_mappings(Message, update_buffer)
+        
+        # retry_count is relative, so failed rows get one set-based increment
+        failed_ids = [m["id"] for m in update_buffer if m["status"] == MessageStatus.FAILED]
+        if failed_ids:
+            self.db.execute(
+                update(Message)
+                .where(Message.id.in_(failed_ids))
+                .values(retry_count=Message.retry_count + 1)
+                .execution_options(synchronize_session=False)
+            )
+        
+        self.db.commit()
+        update_buffer.clear()
+    
     async def send_bulk_campaign_messages(
         self,
         campaign_run_id: int,
@@ -725,34 +910,58 @@ class MessageService:
         # Update campaign run status
         campaign_run.status = "RUNNING"
         campaign_run.started_at = datetime.utcnow()
-        self.db.commit()
+        await asyncio.to_thread(self.db.commit)
         
         results = []
         sent_count = 0
         failed_count = 0
+        update_buffer: List[Dict[str, Any]] = []
+        semaphore = asyncio.Semaphore(settings.WHATSAPP_SEND_CONCURRENCY)
         
-        for msg_data in messages:
-            result = await self.send_campaign_message(
-                phone_number=msg_data["phone_number"],
-                template_name=template_name,
-                language_code=language_code,
-                params=msg_data.get("params", []),
-                message_id=msg_data.get("message_id"),
+        async def _send_one(msg_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.send_campaign_message(
+                    phone_number=msg_data["phone_number"],
+                    template_name=template_name,
+                    language_code=language_code,
+                    params=msg_data.get("params", []),
+                    message_id=msg_data.get("message_id"),
+                    update_buffer=update_buffer,
+                )
+        
+        # Sends run concurrently within a batch; the DB is only touched between batches
+        for start in range(0, len(messages), STATUS_UPDATE_BATCH_SIZE):
+            batch = messages[start:start + STATUS_UPDATE_BATCH_SIZE]
+            batch_results = await asyncio.gather(
+                *(_send_one(msg_data) for msg_data in batch),
+                return_exceptions=True,
             )
             
-            results.append(result)
+            for msg_data, result in zip(batch, batch_results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending to {msg_data['phone_number']}: {result}")
+                    result = {
+                        "success": False,
+                        "message_id": None,
+                        "phone_number": msg_data["phone_number"],
+                        "error": str(result),
+                    }
+                
+                results.append(result)
+                
+                if result.get("success"):
+                    sent_count += 1
+                else:
+                    failed_count += 1
             
-            if result.get("success"):
-                sent_count += 1
-            else:
-                failed_count += 1
+            await asyncio.to_thread(self._flush_status_updates, update_buffer)
         
         # Update campaign run stats
         campaign_run.messages_sent = sent_count
         campaign_run.messages_failed = failed_count
         campaign_run.status = "COMPLETED"
         campaign_run.completed_at = datetime.utcnow()
-        self.db.commit()
+        await asyncio.to_thread(self.db.commit)
         
         return {
             "success": True,
@@ -769,79 +978,141 @@ class MessageService:
         timestamp: Optional[datetime] = None,
     ) -> bool:
         """
-        Update message status from webhook callback
+        Update one message's status from a webhook callback
         
         Args:
             whatsapp_message_id: WhatsApp message ID
-            status: New status (delivered, read, failed)
+            status: WhatsApp status (sent, delivered, read, failed)
             timestamp: Optional timestamp from webhook
             
         Returns:
             True if message was found and updated
         """
+        updated = self.update_message_statuses([
+            {"id": whatsapp_message_id, "status": status, "timestamp": timestamp}
+        ])
+        return whatsapp_message_id in updated
+    
+    def update_message_statuses(self, status_updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Apply a batch of webhook status updates
+        
+        Messages are loaded with one IN query and written with one executemany UPDATE;
+        campaign run counters get in-place increments for the net change. A message
+        never moves backwards (e.g. READ -> DELIVERED), so replaying a batch is safe.
+        
+        Args:
+            status_updates: WhatsApp status objects (id, status, timestamp, errors)
+            
+        Returns:
+            Routing rows (jeweller_id, campaign_run_id, previous status) of the
+            updated messages, keyed by WhatsApp message ID
+        """
         from app.models.message import Message
-        from app.utils.enums import MessageStatus
         
-        message = self.db.query(Message).filter(
-            Message.whatsapp_message_id == whatsapp_message_id
-        ).first()
+        received_at = datetime.utcnow()  # Fallback for statuses without a usable timestamp
+        transitions = _collapse_status_updates(status_updates, received_at)
+        if not transitions:
+            return {}
         
-        if not message:
-            logger.warning(f"Message not found for WhatsApp ID: {whatsapp_message_id}")
-            return False
+        # Routing columns plus the current status, via the unique whatsapp_message_id index
+        messages = {
+            row.whatsapp_message_id: row
+            for row in self.db.query(
+                Message.whatsapp_message_id,
+                Message.jeweller_id,
+                Message.campaign_run_id,
+                Message.status,
+            ).filter(Message.whatsapp_message_id.in_(list(transitions))).all()
+        }
         
-        # Map status and update
-        status_map = whatsapp_service.map_status_to_internal(status)
-        message.status = status_map
+        params = []
+        updated = {}
+        for whatsapp_message_id, transition in transitions.items():
+            message = messages.get(whatsapp_message_id)
+            if not message:
+                logger.warning(f"Message not found for WhatsApp ID: {whatsapp_message_id}")
+                continue
+            
+            # Out-of-order callbacks must not move a message backwards
+            if not _is_forward_transition(message.status, transition["status"]):
+                logger.info(
+                    f"Ignoring stale '{transition['status'].value}' for {whatsapp_message_id} "
+                    f"(currently {message.status.value})"
+                )
+                continue
+            
+            params.append({
+                "wa_id": whatsapp_message_id,
+                "new_status": transition["status"],
+                "reason": transition["reason"],
+                **{f"ts_{column}": transition["timestamps"].get(column) for column in LIFECYCLE_COLUMNS},
+            })
+            updated[whatsapp_message_id] = message
         
-        timestamp = timestamp or datetime.utcnow()
+        if not params:
+            return {}
         
-        if status_map == MessageStatus.DELIVERED:
-            message.delivered_at = timestamp
-        elif status_map == MessageStatus.READ:
-            message.read_at = timestamp
-        elif status_map == MessageStatus.FAILED:
-            message.failed_at = timestamp
+        # Timestamps of superseded steps (e.g. delivered_at when delivered and read
+        # arrive together) are kept; bind names must not collide with SET columns
+        messages_table = Message.__table__
+        self.db.execute(
+            update(messages_table)
+            .where(messages_table.c.whatsapp_message_id == bindparam("wa_id"))
+            .values(
+                status=bindparam("new_status", type_=messages_table.c.status.type),
+                failure_reason=func.coalesce(bindparam("reason"), messages_table.c.failure_reason),
+                **{
+                    column: func.coalesce(
+                        bindparam(f"ts_{column}", type_=messages_table.c[column].type),
+                        messages_table.c[column],
+                    )
+                    for column in LIFECYCLE_COLUMNS
+                },
+            ),
+            params,
+        )
         
-        message.updated_at = datetime.utcnow()
+        self._apply_run_stat_deltas(updated, {p["wa_id"]: p["new_status"] for p in params})
         self.db.commit()
         
-        # Update campaign run stats if applicable
-        if message.campaign_run_id:
-            self._update_campaign_run_stats(message.campaign_run_id)
-        
-        return True
+        return updated
     
-    def _update_campaign_run_stats(self, campaign_run_id: int) -> None:
+    def _apply_run_stat_deltas(self, messages: Dict[str, Any], final_status: Dict[str, MessageStatus]) -> None:
         """
-        Update campaign run statistics based on message statuses
+        Adjust campaign run counters by the net effect of a batch's status changes.
         
-        Args:
-            campaign_run_id: Campaign run ID to update
+        One executemany of "counter = counter + delta" replaces recounting every
+        message of the run. Drift from writers that bypass this path is corrected
+        by the periodic reconcile_campaign_run_stats task.
         """
         from app.models.campaign import CampaignRun
-        from app.models.message import Message
-        from app.utils.enums import MessageStatus
         
-        campaign_run = self.db.query(CampaignRun).filter(
-            CampaignRun.id == campaign_run_id
-        ).first()
+        deltas = {}
+        for wa_id, new_status in final_status.items():
+            message = messages[wa_id]
+            if not message.campaign_run_id or message.status == new_status:
+                continue
+            run_delta = deltas.setdefault(message.campaign_run_id, dict.fromkeys(RUN_STAT_COLUMNS.values(), 0))
+            if message.status in RUN_STAT_COLUMNS:
+                run_delta[RUN_STAT_COLUMNS[message.status]] -= 1
+            if new_status in RUN_STAT_COLUMNS:
+                run_delta[RUN_STAT_COLUMNS[new_status]] += 1
         
-        if not campaign_run:
+        params = [
+            {"run_id": run_id, **{f"d_{column}": n for column, n in delta.items()}}
+            for run_id, delta in deltas.items() if any(delta.values())
+        ]
+        if not params:
             return
         
-        # Count messages by status
-        messages = self.db.query(Message).filter(
-            Message.campaign_run_id == campaign_run_id
-        ).all()
-        
-        delivered = sum(1 for m in messages if m.status == MessageStatus.DELIVERED)
-        read = sum(1 for m in messages if m.status == MessageStatus.READ)
-        failed = sum(1 for m in messages if m.status == MessageStatus.FAILED)
-        
-        campaign_run.messages_delivered = delivered
-        campaign_run.messages_read = read
-        campaign_run.messages_failed = failed
-        campaign_run.updated_at = datetime.utcnow()
-        
-        self.db.commit()
+        runs_table = CampaignRun.__table__
+        self.db.execute(
+            update(runs_table)
+            .where(runs_table.c.id == bindparam("run_id"))
+            .values(**{
+                column: runs_table.c[column] + bindparam(f"d_{column}")
+                for column in RUN_STAT_COLUMNS.values()
+            }),
+            params,
+        )
@@ -14,6 +14,7 @@ from app.database import SessionLocal
 from app.models.jeweller import Jeweller
 from app.core.encryption import encrypt_token, decrypt_token, TokenEncryptionError
 from app.config import settings
+from app.services.whatsapp_service import get_graph_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +39,9 @@ def refresh_whatsapp_token(jeweller_id: int, current_token: str) -> dict:
     }
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = get_graph_http_client().get(url, params=params)
+        response.raise_for_status()
+        data = response.json()
 
         access_token = data.get("access_token")
         expires_in = data.get("expires_in", 5184000)  # Default 60 days
@@ -1,13 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.config import settings
 from app.models.webhook import WebhookEvent
-from app.models.message import Message
 from app.models.jeweller import Jeweller
-from app.utils.enums import MessageStatus
 from app.services.template_service import MessageService
-import json
+import orjson
 import hmac
 import hashlib
 from datetime import datetime
@@ -16,6 +14,12 @@ import logging
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/webhooks", tags=["Webhooks"])
 
+# Keyed once at import; copy() per request skips re-running the HMAC key schedule
+_HMAC_TEMPLATE = (
+    hmac.new(settings.WHATSAPP_APP_SECRET.encode(), digestmod=hashlib.sha256)
+    if settings.WHATSAPP_APP_SECRET else None
+)
+
 
 def verify_webhook_signature(payload: bytes, signature: str) -> bool:
     """
@@ -28,26 +32,28 @@ def verify_webhook_signature(payload: bytes, signature: str) -> bool:
     Returns:
         True if signature is valid
     """
-    if not settings.WHATSAPP_APP_SECRET:
+    if _HMAC_TEMPLATE is None:
         # Skip verification if app secret not configured (development mode)
         return True
     
     if not signature or not signature.startswith("sha256="):
         return False
     
-    expected_signature = hmac.new(
-        settings.WHATSAPP_APP_SECRET.encode(),
-        payload,
-        hashlib.sha256
-    ).hexdigest()
+    try:
+        signature_bytes = bytes.fromhex(signature[7:])
+    except ValueError:
+        return False
+    
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(payload)
     
-    return hmac.compare_digest(f"sha256={expected_signature}", signature)
+    return hmac.compare_digest(mac.digest(), signature_bytes)
 
 
 @router.post("/whatsapp")
 async def whatsapp_webhook(
     request: Request,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
 ):
     """
     WhatsApp webhook endpoint for receiving message status updates (Multi-tenant)
@@ -68,9 +74,50 @@ async def whatsapp_webhook(
             detail="Invalid webhook signature"
         )
     
-    # Parse JSON payload
-    payload = json.loads(raw_payload)
-    payload_str = json.dumps(payload)
+    # Parse before ACKing so a malformed body is rejected instead of silently dropped
+    try:
+        payload = orjson.loads(raw_payload)
+    except orjson.JSONDecodeError:
+        payload = None
+    if not isinstance(payload, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid webhook payload"
+        )
+    
+    # ACK immediately; storage and status updates run after the response is sent.
+    # Sync background tasks run in the threadpool, so DB calls never block the event loop.
+    # Events that fail to apply stay unprocessed and are retried by replay_failed_webhook_events.
+    background_tasks.add_task(_process_webhook_in_background, raw_payload, payload)
+    return {"status": "accepted"}
+
+
+def _process_webhook_in_background(raw_payload: bytes, payload: dict) -> None:
+    """Background task wrapper: request-scoped sessions are closed before it runs"""
+    db = SessionLocal()
+    try:
+        result = _process_webhook_payload(db, raw_payload, payload)
+        if result.get("status") == "error":
+            logger.error(f"Webhook processing failed: {result.get('message')}")
+    except Exception as e:
+        logger.error(f"Webhook processing crashed: {str(e)}")
+    finally:
+        db.close()
+
+
+def _process_webhook_payload(db: Session, raw_payload: bytes, payload: dict) -> dict:
+    """Store the webhook event and apply any message status updates it carries"""
+    # The raw body was already parsed as valid JSON, so store it as-is
+    payload_str = raw_payload.decode("utf-8")
+    
+    # Skip noise events (no "messages" field changes) before touching the database
+    has_message_changes = any(
+        change.get("field") == "messages"
+        for entry in payload.get("entry") or []
+        for change in entry.get("changes") or []
+    )
+    if not has_message_changes:
+        return {"status": "ignored"}
     
     # Try to identify jeweller from payload
     jeweller_id = None
@@ -103,7 +150,8 @@ async def whatsapp_webhook(
     except Exception as e:
         logger.error(f"Error identifying jeweller from webhook payload: {str(e)}")
     
-    # Store webhook event with jeweller context
+    # Store webhook event with jeweller context, committed on its own so a failure
+    # while applying it still leaves an unprocessed row for the replay task
     webhook_event = WebhookEvent(
         event_type="message_status",
         payload=payload_str,
@@ -111,14 +159,25 @@ async def whatsapp_webhook(
         received_at=datetime.utcnow()
     )
     db.add(webhook_event)
+    db.commit()
     
-    # Initialize message service
-    message_service = MessageService(db)
+    return apply_webhook_event(db, webhook_event, payload)
+
+
+def apply_webhook_event(db: Session, webhook_event: WebhookEvent, payload: dict) -> dict:
+    """
+    Apply the message status updates carried by a stored webhook event.
     
+    Marks the event processed on success. On failure the event is left unprocessed
+    with its error so it can be replayed; status writes are forward-only, so a replay
+    of an event whose updates already landed changes nothing.
+    """
     try:
         # Parse WhatsApp payload
         # Format: https://developers.facebook.com/docs/whatsapp/cloud-api/webhooks/payload-examples
         
+        # Collect status updates across the batch so their messages can be loaded in one query
+        status_updates = []
         if "entry" in payload:
             for entry in payload["entry"]:
                 if "changes" in entry:
@@ -128,45 +187,7 @@ async def whatsapp_webhook(
                             
                             # Process status updates
                             if "statuses" in value:
-                                for status_update in value["statuses"]:
-                                    whatsapp_message_id = status_update.get("id")
-                                    status_value = status_update.get("status")
-                                    timestamp_str = status_update.get("timestamp")
-                                    
-                                    # Convert timestamp
-                                    timestamp = None
-                                    if timestamp_str:
-                                        try:
-                                            timestamp = datetime.fromtimestamp(int(timestamp_str))
-                                        except (ValueError, TypeError):
-                                            timestamp = datetime.utcnow()
-                                    
-                                    # Use message service to update status
-                                    updated = message_service.update_message_status(
-                                        whatsapp_message_id=whatsapp_message_id,
-                                        status=status_value,
-                                        timestamp=timestamp
-                                    )
-                                    
-                                    # If message found, get jeweller_id for webhook event
-                                    if updated:
-                                        message = db.query(Message).filter(
-                                            Message.whatsapp_message_id == whatsapp_message_id
-                                        ).first()
-                                        if message:
-                                            webhook_event.jeweller_id = message.jeweller_id
-                                    
-                                    # Handle errors in status update
-                                    if status_value == "failed":
-                                        errors = status_update.get("errors", [])
-                                        if errors:
-                                            error_msg = errors[0].get("message", "Unknown error")
-                                            message = db.query(Message).filter(
-                                                Message.whatsapp_message_id == whatsapp_message_id
-                                            ).first()
-                                            if message:
-                                                message.failure_reason = error_msg
-                                                message.updated_at = datetime.utcnow()
+                                status_updates.extend(value["statuses"])
                             
                             # Process incoming messages (for future use)
                             if "messages" in value:
@@ -176,18 +197,27 @@ async def whatsapp_webhook(
                                     message_type = incoming_message.get("type")
                                     # TODO: Handle incoming messages if needed
         
+        # Written in one batch; the service collapses repeated callbacks per message
+        updated = MessageService(db).update_message_statuses(status_updates)
+        
+        # Attribute the webhook event to the jeweller of the updated messages
+        for message in updated.values():
+            webhook_event.jeweller_id = message.jeweller_id
+        
         webhook_event.processed = True
         webhook_event.processed_at = datetime.utcnow()
+        webhook_event.error_message = None
         db.commit()
         
         return {"status": "success"}
     
     except Exception as e:
+        # A failed flush leaves the session unusable until rolled back
+        db.rollback()
         webhook_event.processed = False
         webhook_event.error_message = str(e)
         db.commit()
         
-        # Still return 200 to prevent WhatsApp from retrying
         return {"status": "error", "message": str(e)}
 
 
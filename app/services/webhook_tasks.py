@@ -0,0 +1,62 @@
+"""
+Celery Tasks for WhatsApp Webhooks
+Replays stored webhook events whose status updates failed to apply.
+"""
+import logging
+from datetime import datetime, timedelta
+
+import orjson
+
+from app.celery_app import celery_app
+from app.models.webhook import WebhookEvent
+from app.services.base_task import DatabaseTask
+from app.services.webhook_routes import apply_webhook_event
+
+logger = logging.getLogger(__name__)
+
+# Events younger than this may still be in their original background task
+WEBHOOK_REPLAY_MIN_AGE_MINUTES = 5
+# Events older than this are left for manual inspection
+WEBHOOK_REPLAY_MAX_AGE_HOURS = 24
+WEBHOOK_REPLAY_BATCH_SIZE = 200
+
+
+@celery_app.task(bind=True, base=DatabaseTask, name='app.services.webhook_tasks.replay_failed_webhook_events')
+def replay_failed_webhook_events(self):
+    """
+    Periodic task: Re-apply webhook events left unprocessed.
+    WhatsApp does not redeliver webhooks that were ACKed, so an event whose
+    processing failed (or whose worker died) is only recovered here.
+    Status updates are forward-only, so replaying an event is safe.
+    """
+    db = self.db
+
+    try:
+        now = datetime.utcnow()
+        events = (
+            db.query(WebhookEvent)
+            .filter(
+                WebhookEvent.processed_at.is_(None),
+                WebhookEvent.received_at >= now - timedelta(hours=WEBHOOK_REPLAY_MAX_AGE_HOURS),
+                WebhookEvent.received_at < now - timedelta(minutes=WEBHOOK_REPLAY_MIN_AGE_MINUTES),
+            )
+            .order_by(WebhookEvent.received_at)
+            .limit(WEBHOOK_REPLAY_BATCH_SIZE)
+            .all()
+        )
+        if not events:
+            return
+
+        replayed = 0
+        for event in events:
+            result = apply_webhook_event(db, event, orjson.loads(event.payload))
+            if result.get("status") == "success":
+                replayed += 1
+            else:
+                logger.error(f"❌ Replay of webhook event {event.id} failed: {result.get('message')}")
+
+        logger.info(f"✅ Replayed {replayed}/{len(events)} unprocessed webhook events")
+
+    except Exception as e:
+        logger.error(f"❌ Error replaying webhook events: {str(e)}")
+        raise
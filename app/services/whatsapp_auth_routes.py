@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import timedelta
 import httpx
+import orjson
 import secrets
 import logging
 from jose import jwt, JWTError
@@ -24,6 +25,7 @@ from app.schemas.auth import (
     WhatsAppDisconnectResponse
 )
 from app.config import settings
+from app.services.whatsapp_service import get_graph_async_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth/whatsapp", tags=["WhatsApp Authentication"])
@@ -75,17 +77,17 @@ async def exchange_code_for_token(code: str) -> dict:
         "code": code
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, params=params, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Token exchange failed: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to exchange authorization code: {str(e)}"
-            )
+    client = get_graph_async_client()
+    try:
+        response = await client.get(url, params=params, timeout=30.0)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPError as e:
+        logger.error(f"Token exchange failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to exchange authorization code: {str(e)}"
+        )
 
 
 async def get_long_lived_token(short_lived_token: str) -> dict:
@@ -100,14 +102,14 @@ async def get_long_lived_token(short_lived_token: str) -> dict:
         "fb_exchange_token": short_lived_token
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, params=params, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Long-lived token exchange failed: {str(e)}")
-            return {"access_token": short_lived_token, "expires_in": 3600}
+    client = get_graph_async_client()
+    try:
+        response = await client.get(url, params=params, timeout=30.0)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPError as e:
+        logger.error(f"Long-lived token exchange failed: {str(e)}")
+        return {"access_token": short_lived_token, "expires_in": 3600}
 
 
 async def get_token_info(access_token: str) -> dict:
@@ -120,18 +122,18 @@ async def get_token_info(access_token: str) -> dict:
         "access_token": f"{settings.WHATSAPP_APP_ID}|{settings.WHATSAPP_APP_SECRET}"
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, params=params, timeout=30.0)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {})
-        except httpx.HTTPError as e:
-            logger.error(f"Token debug failed: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to validate token: {str(e)}"
-            )
+    client = get_graph_async_client()
+    try:
+        response = await client.get(url, params=params, timeout=30.0)
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {})
+    except httpx.HTTPError as e:
+        logger.error(f"Token debug failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to validate token: {str(e)}"
+        )
 
 
 async def get_waba_details(waba_id: str, access_token: str) -> dict:
@@ -144,14 +146,14 @@ async def get_waba_details(waba_id: str, access_token: str) -> dict:
         "access_token": access_token
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, params=params, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"WABA details fetch failed: {str(e)}")
-            return {}
+    client = get_graph_async_client()
+    try:
+        response = await client.get(url, params=params, timeout=30.0)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except httpx.HTTPError as e:
+        logger.error(f"WABA details fetch failed: {str(e)}")
+        return {}
 
 
 async def get_phone_numbers(waba_id: str, access_token: str) -> list:
@@ -160,18 +162,18 @@ async def get_phone_numbers(waba_id: str, access_token: str) -> list:
     """
     url = f"https://graph.facebook.com/{settings.WHATSAPP_API_VERSION}/{waba_id}/phone_numbers"
     params = {
+        "fields": "id,display_phone_number,verified_name",
         "access_token": access_token
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, params=params, timeout=30.0)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", [])
-        except httpx.HTTPError as e:
-            logger.error(f"Phone numbers fetch failed: {str(e)}")
-            return []
+    client = get_graph_async_client()
+    try:
+        response = await client.get(url, params=params, timeout=30.0)
+        response.raise_for_status()
+        return orjson.loads(response.content).get("data", [])
+    except httpx.HTTPError as e:
+        logger.error(f"Phone numbers fetch failed: {str(e)}")
+        return []
 
 
 async def subscribe_waba_to_webhook(waba_id: str, access_token: str) -> bool:
@@ -180,18 +182,18 @@ async def subscribe_waba_to_webhook(waba_id: str, access_token: str) -> bool:
     """
     url = f"https://graph.facebook.com/{settings.WHATSAPP_API_VERSION}/{waba_id}/subscribed_apps"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                url,
-                params={"access_token": access_token},
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return True
-        except httpx.HTTPError as e:
-            logger.error(f"Webhook subscription failed: {str(e)}")
-            return False
+    client = get_graph_async_client()
+    try:
+        response = await client.post(
+            url,
+            params={"access_token": access_token},
+            timeout=30.0
+        )
+        response.raise_for_status()
+        return True
+    except httpx.HTTPError as e:
+        logger.error(f"Webhook subscription failed: {str(e)}")
+        return False
 
 
 async def notify_admin_whatsapp_connected(jeweller_id: int, db: Session):
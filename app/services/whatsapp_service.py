@@ -5,13 +5,19 @@ Uses pywa for async support with FastAPI
 Now supports multi-tenant: per-jeweller WhatsApp clients + platform client
 """
 import re
+import time
+import threading
+import asyncio
 import logging
 from typing import Optional, List, Dict, Any
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache, wraps
 from app.core.datetime_utils import now_utc
 from datetime import datetime, timedelta
 
 import httpx
+import orjson
 from sqlalchemy.orm import Session
 
 try:
@@ -23,11 +29,100 @@ except ImportError:
     WhatsApp = None
     WhatsAppError = Exception
 
+# Resolve once whether pywa's send responses carry an .id, instead of probing every response
+try:
+    from pywa.types import SentMessage
+    _PYWA_HAS_ID = 'id' in getattr(SentMessage, '__dataclass_fields__', {}) or hasattr(SentMessage, 'id')
+except ImportError:
+    _PYWA_HAS_ID = False
+
 from app.config import settings
 from app.utils.enums import Language, MessageStatus
 
 logger = logging.getLogger(__name__)
 
+# Template definitions change on human timescales; refetch the WABA list at most this often
+TEMPLATE_CACHE_TTL_SECONDS = 300
+
+# Bulk-send backpressure: pause all workers when more than BULK_THROTTLE_LIMIT of the
+# last BULK_THROTTLE_WINDOW sends were rejected with a Graph API rate-limit error
+BULK_THROTTLE_WINDOW = 100
+BULK_THROTTLE_LIMIT = 5
+BULK_THROTTLE_BACKOFF_SECONDS = 30
+_THROTTLE_ERROR_CODES = frozenset({"4", "80007", "130429", "131048", "131056"})
+
+_WA_STATUS_MAP = {
+    "sent": MessageStatus.SENT,
+    "delivered": MessageStatus.DELIVERED,
+    "read": MessageStatus.READ,
+    "failed": MessageStatus.FAILED,
+}
+
+
+_graph_http_client: Optional[httpx.Client] = None
+
+
+def get_graph_http_client() -> httpx.Client:
+    """Return the process-wide Graph API HTTP client.
+
+    Created lazily so each Celery worker process builds its own pool after fork;
+    keep-alive connections then spare every send a TCP + TLS handshake.
+    """
+    global _graph_http_client
+    if _graph_http_client is None:
+        _graph_http_client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _graph_http_client
+
+
+GRAPH_API_BASE_URL = f"https://graph.facebook.com/{settings.WHATSAPP_API_VERSION}"
+
+
+@lru_cache(maxsize=1024)
+def _messages_url(phone_number_id: str) -> str:
+    """Messages endpoint for a sender phone number (one entry per connected jeweller)"""
+    return f"{GRAPH_API_BASE_URL}/{phone_number_id}/messages"
+
+
+@lru_cache(maxsize=1024)
+def _json_auth_headers(access_token: str) -> Dict[str, str]:
+    """Bearer + JSON headers for a token; callers must treat the dict as read-only"""
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": "application/json",
+    }
+
+
+_graph_async_client: Optional[httpx.AsyncClient] = None
+
+
+def get_graph_async_client() -> httpx.AsyncClient:
+    """Return the shared async Graph API client used by request handlers.
+
+    One pooled client per process means OAuth and WABA lookups reuse open
+    TLS connections to graph.facebook.com instead of dialing on every call.
+    """
+    global _graph_async_client
+    if _graph_async_client is None:
+        _graph_async_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+        )
+    return _graph_async_client
+
+
+async def aclose_graph_clients() -> None:
+    """Close the pooled Graph API clients (called on application shutdown)"""
+    global _graph_http_client, _graph_async_client
+    if _graph_async_client is not None:
+        await _graph_async_client.aclose()
+        _graph_async_client = None
+    if _graph_http_client is not None:
+        _graph_http_client.close()
+        _graph_http_client = None
+
 
 class WhatsAppServiceError(Exception):
     """Custom exception for WhatsApp service errors"""
@@ -38,7 +133,7 @@ class WhatsAppServiceError(Exception):
         super().__init__(self.message)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MessageResult:
     """Result of a message send operation"""
     success: bool
@@ -47,8 +142,14 @@ class MessageResult:
     error: Optional[str] = None
     error_code: Optional[str] = None
 
+    def as_dict(self) -> Dict[str, Any]:
+        """Dict shape returned by the module-level convenience senders"""
+        if self.success:
+            return {"success": True, "message_id": self.message_id, "phone_number": self.phone_number}
+        return {"success": False, "error": self.error, "error_code": self.error_code}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TemplateResult:
     """Result of a template operation"""
     success: bool
@@ -58,6 +159,95 @@ class TemplateResult:
     error: Optional[str] = None
 
 
+def _send_failure(
+    phone_number: Optional[str],
+    context: str,
+    error: Any,
+    error_code: Optional[str] = None,
+) -> MessageResult:
+    """Log a failed send (lazily formatted) and build its MessageResult"""
+    logger.error("WhatsApp send to %s failed (%s): %s", phone_number, context, error)
+    return MessageResult(success=False, phone_number=phone_number, error=str(error), error_code=error_code)
+
+
+def _sendable_phone_number(phone_number: Optional[str]) -> Optional[str]:
+    """
+    Strip formatting (spaces, dashes, parentheses) and normalize a stored number for sending.
+    Returns None for numbers the Graph API would 400 on, so no round-trip is spent on them.
+    """
+    if not phone_number:
+        return None
+    normalized = normalize_phone_number(phone_number)
+    return normalized if _SENDABLE_PHONE_RE.match(normalized) else None
+
+
+def _invalid_phone_result(phone_number: Optional[str]) -> MessageResult:
+    """Failed MessageResult for a number rejected by _sendable_phone_number"""
+    logger.warning("Skipping send to invalid phone number %r", phone_number)
+    return MessageResult(
+        success=False,
+        phone_number=phone_number,
+        error="Phone number is not in E.164 format",
+        error_code="invalid_e164",
+    )
+
+
+def _wrap_send(kind: str):
+    """
+    Turn a send method that returns the raw pywa response into one that returns a MessageResult.
+    MessageResults returned by the body (e.g. dev-mode stubs) pass through unchanged.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, phone_number: str, *args, **kwargs) -> MessageResult:
+            sendable = _sendable_phone_number(phone_number)
+            if sendable is None:
+                return _invalid_phone_result(phone_number)
+            phone_number = sendable
+            try:
+                response = await func(self, phone_number, *args, **kwargs)
+                if isinstance(response, MessageResult):
+                    return response
+                message_id = response.id if _PYWA_HAS_ID else str(response)
+            except WhatsAppError as e:
+                return _send_failure(phone_number, f"{kind} API error", e, getattr(e, 'error_code', None))
+            except Exception as e:
+                return _send_failure(phone_number, kind, e)
+
+            logger.info("%s message sent successfully to %s", kind.capitalize(), phone_number)
+            return MessageResult(success=True, message_id=message_id, phone_number=phone_number)
+        return wrapper
+    return decorator
+
+
+# Template language codes accepted by the Graph API, resolved once at import
+TEMPLATE_LANGUAGE_MAP: Dict[str, str] = {
+    "en": "en",
+    "en_US": "en_US",
+    "en_GB": "en_GB",
+    "hi": "hi",
+    "kn": "kn",
+    "ta": "ta",
+    "te": "te",
+    "mr": "mr",
+    "gu": "gu",
+    "bn": "bn",
+    "ml": "ml",
+    "pa": "pa",
+    "or": "or",
+    "as": "as",
+    "ur": "ur",
+}
+
+# Every accepted spelling (en_US, EN_US, en-us, ...) resolved up front so a send is one dict lookup
+_TEMPLATE_LANGUAGE_LOOKUP: Dict[str, str] = {
+    alias: language
+    for code, language in TEMPLATE_LANGUAGE_MAP.items()
+    for variant in (code, code.replace("_", "-"))
+    for alias in (variant, variant.lower(), variant.upper())
+}
+
+
 def get_template_language(language_code: str) -> str:
     """
     Convert language code to WhatsApp language string
@@ -68,24 +258,7 @@ def get_template_language(language_code: str) -> str:
     Returns:
         Language string (e.g., 'en', 'en_US', 'hi')
     """
-    language_map = {
-        "en": "en",
-        "en_US": "en_US",
-        "en_GB": "en_GB",
-        "hi": "hi",
-        "kn": "kn",
-        "ta": "ta",
-        "te": "te",
-        "mr": "mr",
-        "gu": "gu",
-        "bn": "bn",
-        "ml": "ml",
-        "pa": "pa",
-        "or": "or",
-        "as": "as",
-        "ur": "ur",
-    }
-    return language_map.get(language_code, "en")
+    return _TEMPLATE_LANGUAGE_LOOKUP.get(language_code, "en")
 
 
 # ==================== MULTI-TENANT CLIENT MANAGEMENT ====================
@@ -109,7 +282,7 @@ def get_jeweller_whatsapp_client(jeweller_id: int, db: Session) -> Optional[Any]
     from app.core.encryption import decrypt_token, TokenEncryptionError
 
     if not PYWA_AVAILABLE:
-        logger.warning(f"PyWa library not available for jeweller {jeweller_id}")
+        logger.warning("PyWa library not available for jeweller %s", jeweller_id)
         return None
 
     jeweller = db.query(Jeweller).filter(Jeweller.id == jeweller_id).first()
@@ -131,13 +304,13 @@ def get_jeweller_whatsapp_client(jeweller_id: int, db: Session) -> Optional[Any]
         days_until_expiry = (jeweller.access_token_expires_at - now_utc()).days
         if days_until_expiry < 7:
             logger.warning(
-                f"WhatsApp token for jeweller {jeweller_id} expires in {days_until_expiry} days"
+                "WhatsApp token for jeweller %s expires in %s days", jeweller_id, days_until_expiry
             )
 
     try:
         decrypted_token = decrypt_token(jeweller.access_token)
     except TokenEncryptionError as e:
-        logger.error(f"Failed to decrypt token for jeweller {jeweller_id}: {e}")
+        logger.error("Failed to decrypt token for jeweller %s: %s", jeweller_id, e)
         raise WhatsAppServiceError(
             f"Failed to decrypt WhatsApp token for jeweller {jeweller_id}",
             error_code="DECRYPTION_FAILED",
@@ -149,10 +322,10 @@ def get_jeweller_whatsapp_client(jeweller_id: int, db: Session) -> Optional[Any]
             token=decrypted_token,
             business_account_id=jeweller.waba_id,
         )
-        logger.info(f"WhatsApp client created for jeweller {jeweller_id}")
+        logger.info("WhatsApp client created for jeweller %s", jeweller_id)
         return client
     except Exception as e:
-        logger.error(f"Failed to create WhatsApp client for jeweller {jeweller_id}: {e}")
+        logger.error("Failed to create WhatsApp client for jeweller %s: %s", jeweller_id, e)
         raise WhatsAppServiceError(
             f"Failed to create WhatsApp client: {e}",
             error_code="CLIENT_CREATION_FAILED",
@@ -162,29 +335,13 @@ def get_jeweller_whatsapp_client(jeweller_id: int, db: Session) -> Optional[Any]
 def get_platform_whatsapp_client() -> Optional[Any]:
     """
     Get the platform WhatsApp client for OTPs and admin notifications.
-    Uses global platform credentials from settings.
+    Returns the client owned by the WhatsAppService singleton, so its HTTP
+    connection pool is shared instead of being rebuilt on every call.
 
     Returns:
         WhatsApp client instance or None if not configured
     """
-    if not PYWA_AVAILABLE:
-        logger.warning("PyWa library not available for platform client")
-        return None
-
-    if not settings.WHATSAPP_PHONE_NUMBER_ID or not settings.WHATSAPP_ACCESS_TOKEN:
-        logger.warning("Platform WhatsApp credentials not configured")
-        return None
-
-    try:
-        client = WhatsApp(
-            phone_id=settings.WHATSAPP_PHONE_NUMBER_ID,
-            token=settings.WHATSAPP_ACCESS_TOKEN,
-            business_account_id=settings.WHATSAPP_BUSINESS_ACCOUNT_ID or None,
-        )
-        return client
-    except Exception as e:
-        logger.error(f"Failed to create platform WhatsApp client: {e}")
-        return None
+    return WhatsAppService()._client
 
 
 async def send_admin_notification(jeweller_id: int, event: str, db: Session) -> bool:
@@ -202,12 +359,11 @@ async def send_admin_notification(jeweller_id: int, event: str, db: Session) ->
     """
     from app.models.user import User
     from app.models.jeweller import Jeweller
-    from app.services.whatsapp_service import WhatsAppService
 
     try:
         jeweller = db.query(Jeweller).filter(Jeweller.id == jeweller_id).first()
         if not jeweller:
-            logger.error(f"Jeweller {jeweller_id} not found for admin notification")
+            logger.error("Jeweller %s not found for admin notification", jeweller_id)
             return False
 
         admins = db.query(User).filter(User.is_admin == True, User.is_active == True).all()
@@ -229,14 +385,14 @@ async def send_admin_notification(jeweller_id: int, event: str, db: Session) ->
             try:
                 await client.send_message(to=admin.phone_number, text=message)
                 success_count += 1
-                logger.info(f"Admin notification sent to {admin.email}")
+                logger.info("Admin notification sent to %s", admin.email)
             except Exception as e:
-                logger.error(f"Failed to send admin notification to {admin.email}: {e}")
+                logger.error("Failed to send admin notification to %s: %s", admin.email, e)
 
         return success_count > 0
 
     except Exception as e:
-        logger.error(f"Failed to send admin notification: {e}")
+        logger.error("Failed to send admin notification: %s", e)
         return False
 
 
@@ -277,18 +433,34 @@ class WhatsAppService:
     """
 
     _instance: Optional['WhatsAppService'] = None
+    _lock = threading.Lock()
+    _initialized: bool = False
     _client: Optional[Any] = None
+    # Whether the platform client is usable; set once in __init__ (config is fixed after startup)
+    is_configured: bool = False
+    _templates: Optional[List[Dict[str, Any]]] = None
+    _template_index: Dict[str, Dict[str, Any]] = {}
+    _templates_fetched_at: float = 0.0
+    _template_lock = threading.Lock()
 
     def __new__(cls):
-        """Singleton pattern for platform WhatsApp client"""
+        """Singleton pattern for platform WhatsApp client (double-checked so threads share one instance)"""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self):
-        """Initialize platform WhatsApp client if not already done"""
-        if self._client is None:
+        """Initialize platform WhatsApp client once per process"""
+        if self._initialized:
+            return
+        with self._lock:
+            if self._initialized:
+                return
             self._initialize_client()
+            self.is_configured = self._client is not None and PYWA_AVAILABLE
+            self._initialized = True
 
     def _initialize_client(self) -> None:
         """Initialize the PyWa async WhatsApp client for PLATFORM use (OTPs, admin messages)"""
@@ -310,16 +482,12 @@ class WhatsAppService:
             )
             logger.info("WhatsApp async client initialized successfully (pywa 3.8.0)")
         except Exception as e:
-            logger.error(f"Failed to initialize WhatsApp client: {e}")
+            logger.error("Failed to initialize WhatsApp client: %s", e)
             self._client = None
 
-    @property
-    def is_configured(self) -> bool:
-        """Check if WhatsApp client is properly configured"""
-        return self._client is not None and PYWA_AVAILABLE
-
     # ==================== MESSAGING METHODS ====================
 
+    @_wrap_send("template")
     async def send_template_message(
         self,
         phone_number: str,
@@ -343,51 +511,42 @@ class WhatsAppService:
         Returns:
             MessageResult with success status and message ID
         """
-        if not self.is_configured:
-            logger.warning(f"[DEV MODE] Template message to {phone_number}: {template_name}")
-            return MessageResult(
-                success=True,
-                message_id=f"dev_mode_{template_name}_{phone_number[-4:]}",
-                phone_number=phone_number,
-            )
+        components = []
 
-        try:
-            template_language = get_template_language(language_code)
-            components = []
-
-            if header_params:
-                components.append({
-                    "type": "header",
-                    "parameters": [{"type": "text", "text": param} for param in header_params],
-                })
-            if body_params:
-                components.append({
-                    "type": "body",
-                    "parameters": [{"type": "text", "text": param} for param in body_params],
-                })
-
-            response = await self._client.send_template(
-                to=phone_number,
-                template=template_name,
-                language=template_language,
-                components=components if components else None,
-            )
+        if header_params:
+            components.append({
+                "type": "header",
+                "parameters": [{"type": "text", "text": param} for param in header_params],
+            })
+        if body_params:
+            components.append({
+                "type": "body",
+                "parameters": [{"type": "text", "text": param} for param in body_params],
+            })
 
-            message_id = response.id if hasattr(response, 'id') else str(response)
-            logger.info(f"Template message sent successfully to {phone_number}")
-            return MessageResult(success=True, message_id=message_id, phone_number=phone_number)
+        return await self._send(
+            phone_number,
+            template_name,
+            "send_template",
+            template=template_name,
+            language=get_template_language(language_code),
+            components=components if components else None,
+        )
 
-        except WhatsAppError as e:
-            logger.error(f"WhatsApp API error sending template: {e}")
+    async def _send(self, phone_number: str, dev_tag: str, method: str, **kwargs) -> Any:
+        """
+        Shared body of the send_* methods: run the named pywa send in a worker thread,
+        or return a dev-mode stub when no client is configured.
+        Errors are turned into MessageResults by _wrap_send on the public method.
+        """
+        if not self.is_configured:
+            logger.warning("[DEV MODE] %s to %s", method, phone_number)
             return MessageResult(
-                success=False,
+                success=True,
+                message_id=f"dev_mode_{dev_tag}_{phone_number[-4:]}",
                 phone_number=phone_number,
-                error=str(e),
-                error_code=getattr(e, 'error_code', None),
             )
-        except Exception as e:
-            logger.error(f"Error sending template message: {e}")
-            return MessageResult(success=False, phone_number=phone_number, error=str(e))
+        return await asyncio.to_thread(getattr(self._client, method), to=phone_number, **kwargs)
 
     # ---- send_template_message_sync helpers ----
 
@@ -469,38 +628,25 @@ class WhatsAppService:
         payload: dict,
     ) -> MessageResult:
         """POST an assembled payload to the WhatsApp Graph API and return a MessageResult."""
-        url = (
-            f"https://graph.facebook.com/{settings.WHATSAPP_API_VERSION}"
-            f"/{phone_number_id}/messages"
-        )
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+            response = get_graph_http_client().post(
+                _messages_url(phone_number_id),
+                content=orjson.dumps(payload),
+                headers=_json_auth_headers(access_token),
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
             message_id = _extract_message_id(data)
-            logger.info(f"Template message sent successfully to {phone_number} via HTTPX")
+            logger.info("Template message sent successfully to %s via HTTPX", phone_number)
             return MessageResult(success=True, message_id=message_id, phone_number=phone_number)
 
         except httpx.HTTPStatusError as e:
             error_body = e.response.text if e.response is not None else str(e)
             error_code = str(e.response.status_code) if e.response is not None else None
-            logger.error(f"WhatsApp HTTP error sending template: {error_body}")
-            return MessageResult(
-                success=False,
-                phone_number=phone_number,
-                error=error_body,
-                error_code=error_code,
-            )
+            return _send_failure(phone_number, "template HTTP error", error_body, error_code)
         except httpx.RequestError as e:
-            logger.error(f"HTTP request failed sending WhatsApp template: {e}")
-            return MessageResult(success=False, phone_number=phone_number, error=str(e))
+            return _send_failure(phone_number, "template request", e)
 
     def send_template_message_sync(
         self,
@@ -520,6 +666,10 @@ class WhatsAppService:
                 phone_number=phone_number,
                 error="WhatsApp credentials are not configured",
             )
+        sendable = _sendable_phone_number(phone_number)
+        if sendable is None:
+            return _invalid_phone_result(phone_number)
+        phone_number = sendable
 
         payload = self._build_template_payload(
             phone_number=phone_number,
@@ -536,6 +686,7 @@ class WhatsAppService:
             payload=payload,
         )
 
+    @_wrap_send("text")
     async def send_text_message(
         self,
         phone_number: str,
@@ -553,36 +704,9 @@ class WhatsAppService:
         Returns:
             MessageResult with success status and message ID
         """
-        if not self.is_configured:
-            logger.warning(f"[DEV MODE] Text message to {phone_number}: {text[:50]}...")
-            return MessageResult(
-                success=True,
-                message_id=f"dev_mode_text_{phone_number[-4:]}",
-                phone_number=phone_number,
-            )
-
-        try:
-            response = await self._client.send_message(
-                to=phone_number,
-                text=text,
-                preview_url=preview_url,
-            )
-            message_id = response.id if hasattr(response, 'id') else str(response)
-            logger.info(f"Text message sent successfully to {phone_number}")
-            return MessageResult(success=True, message_id=message_id, phone_number=phone_number)
-
-        except WhatsAppError as e:
-            logger.error(f"WhatsApp API error sending text: {e}")
-            return MessageResult(
-                success=False,
-                phone_number=phone_number,
-                error=str(e),
-                error_code=getattr(e, 'error_code', None),
-            )
-        except Exception as e:
-            logger.error(f"Error sending text message: {e}")
-            return MessageResult(success=False, phone_number=phone_number, error=str(e))
+        return await self._send(phone_number, "text", "send_message", text=text, preview_url=preview_url)
 
+    @_wrap_send("image")
     async def send_image_message(
         self,
         phone_number: str,
@@ -602,36 +726,11 @@ class WhatsAppService:
         Returns:
             MessageResult with success status and message ID
         """
-        if not self.is_configured:
-            logger.warning(f"[DEV MODE] Image message to {phone_number}")
-            return MessageResult(
-                success=True,
-                message_id=f"dev_mode_image_{phone_number[-4:]}",
-                phone_number=phone_number,
-            )
-
-        try:
-            response = await self._client.send_image(
-                to=phone_number,
-                image=image_url or image_id,
-                caption=caption,
-            )
-            message_id = response.id if hasattr(response, 'id') else str(response)
-            logger.info(f"Image message sent successfully to {phone_number}")
-            return MessageResult(success=True, message_id=message_id, phone_number=phone_number)
-
-        except WhatsAppError as e:
-            logger.error(f"WhatsApp API error sending image: {e}")
-            return MessageResult(
-                success=False,
-                phone_number=phone_number,
-                error=str(e),
-                error_code=getattr(e, 'error_code', None),
-            )
-        except Exception as e:
-            logger.error(f"Error sending image message: {e}")
-            return MessageResult(success=False, phone_number=phone_number, error=str(e))
+        return await self._send(
+            phone_number, "image", "send_image", image=image_url or image_id, caption=caption
+        )
 
+    @_wrap_send("document")
     async def send_document_message(
         self,
         phone_number: str,
@@ -653,36 +752,14 @@ class WhatsAppService:
         Returns:
             MessageResult with success status and message ID
         """
-        if not self.is_configured:
-            logger.warning(f"[DEV MODE] Document message to {phone_number}: {filename}")
-            return MessageResult(
-                success=True,
-                message_id=f"dev_mode_doc_{phone_number[-4:]}",
-                phone_number=phone_number,
-            )
-
-        try:
-            response = await self._client.send_document(
-                to=phone_number,
-                document=document_url or document_id,
-                filename=filename,
-                caption=caption,
-            )
-            message_id = response.id if hasattr(response, 'id') else str(response)
-            logger.info(f"Document message sent successfully to {phone_number}")
-            return MessageResult(success=True, message_id=message_id, phone_number=phone_number)
-
-        except WhatsAppError as e:
-            logger.error(f"WhatsApp API error sending document: {e}")
-            return MessageResult(
-                success=False,
-                phone_number=phone_number,
-                error=str(e),
-                error_code=getattr(e, 'error_code', None),
-            )
-        except Exception as e:
-            logger.error(f"Error sending document message: {e}")
-            return MessageResult(success=False, phone_number=phone_number, error=str(e))
+        return await self._send(
+            phone_number,
+            "doc",
+            "send_document",
+            document=document_url or document_id,
+            filename=filename,
+            caption=caption,
+        )
 
     async def send_otp_message(self, phone_number: str, otp_code: str) -> MessageResult:
         """
@@ -719,18 +796,62 @@ class WhatsAppService:
         Returns:
             List of MessageResult objects
         """
-        results = []
-        for recipient in recipients:
-            result = await self.send_template_message(
-                phone_number=recipient.get("phone_number"),
-                template_name=template_name,
-                language_code=language_code,
-                body_params=recipient.get("params", []),
-            )
-            results.append(result)
-
-        success_count = sum(1 for r in results if r.success)
-        logger.info(f"Bulk send completed: {success_count}/{len(results)} successful")
+        if not self.is_configured:
+            logger.warning("[DEV MODE] Bulk template %s to %s recipients", template_name, len(recipients))
+            return [
+                MessageResult(
+                    success=True,
+                    message_id=f"dev_mode_{template_name}_{r['phone_number'][-4:]}",
+                    phone_number=r["phone_number"],
+                )
+                for r in recipients
+            ]
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, recipient in enumerate(recipients):
+            queue.put_nowait((index, recipient))
+
+        results: List[Optional[MessageResult]] = [None] * len(recipients)
+        recent_throttled: deque = deque(maxlen=BULK_THROTTLE_WINDOW)
+        unthrottled = asyncio.Event()
+        unthrottled.set()
+
+        async def _worker() -> None:
+            while True:
+                try:
+                    index, recipient = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await unthrottled.wait()
+                try:
+                    result = await self.send_template_message(
+                        phone_number=recipient.get("phone_number"),
+                        template_name=template_name,
+                        language_code=language_code,
+                        body_params=recipient.get("params", []),
+                    )
+                except Exception as e:
+                    result = _send_failure(recipient.get("phone_number"), "bulk template", e)
+                results[index] = result
+
+                recent_throttled.append(str(result.error_code) in _THROTTLE_ERROR_CODES)
+                if unthrottled.is_set() and sum(recent_throttled) > BULK_THROTTLE_LIMIT:
+                    # Meta is rate-limiting this number: pause every worker, then resume with a fresh window
+                    logger.warning(
+                        "Bulk send throttled by WhatsApp; pausing %ss", BULK_THROTTLE_BACKOFF_SECONDS
+                    )
+                    unthrottled.clear()
+                    await asyncio.sleep(BULK_THROTTLE_BACKOFF_SECONDS)
+                    recent_throttled.clear()
+                    unthrottled.set()
+
+        # A fixed pool of workers caps in-flight sends; results keep recipient order by index
+        worker_count = min(settings.WHATSAPP_SEND_CONCURRENCY, len(recipients))
+        await asyncio.gather(*(_worker() for _ in range(worker_count)))
+
+        if logger.isEnabledFor(logging.INFO):
+            success_count = sum(r.success for r in results)
+            logger.info("Bulk send completed: %s/%s successful", success_count, len(results))
         return results
 
     # ==================== TEMPLATE MANAGEMENT ====================
@@ -739,6 +860,7 @@ class WhatsAppService:
         self,
         limit: int = 100,
         status_filter: Optional[str] = None,
+        refresh: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve all message templates from WhatsApp Business Account.
@@ -746,6 +868,7 @@ class WhatsAppService:
         Args:
             limit: Maximum number of templates to retrieve
             status_filter: Optional filter by status (APPROVED, PENDING, REJECTED)
+            refresh: Bypass the cached template list and refetch from the Graph API
 
         Returns:
             List of template dictionaries
@@ -764,24 +887,67 @@ class WhatsAppService:
             )
             return []
 
-        try:
-            raw_templates = self._client.get_templates()
-            templates = [_serialize_template(t) for t in raw_templates]
+        if refresh:
+            self._invalidate_template_cache()
+        # Cache hits are served on the event loop; only a refetch needs a worker thread
+        templates = self._fresh_templates()
+        if templates is None:
+            templates = await asyncio.to_thread(self._get_cached_templates)
+        if status_filter:
+            templates = [t for t in templates if t["status"] == status_filter]
+        return templates[:limit]
+
+    def _get_cached_templates(self) -> List[Dict[str, Any]]:
+        """
+        Return every WABA template, refetching once TEMPLATE_CACHE_TTL_SECONDS has lapsed.
+        Failed fetches are not cached so the next call retries.
+        Concurrent callers on a stale cache wait for a single fetch instead of each hitting the API.
+        """
+        templates = self._fresh_templates()
+        if templates is not None:
+            return templates
 
-            if status_filter:
-                templates = [t for t in templates if t["status"] == status_filter]
+        with self._template_lock:
+            templates = self._fresh_templates()
+            if templates is not None:
+                return templates
 
-            templates = templates[:limit]
-            logger.info(f"Retrieved {len(templates)} templates via PyWa")
-            return templates
+            try:
+                # pywa returns one Graph page at a time; follow the cursor so large WABAs are complete
+                page = self._client.get_templates()
+                templates = []
+                while True:
+                    templates.extend(_serialize_template(t) for t in page)
+                    if not getattr(page, 'has_next', False):
+                        break
+                    page = page.next()
+            except httpx.HTTPStatusError as e:
+                error_detail = e.response.text if hasattr(e, 'response') else str(e)
+                logger.error("WhatsApp API error fetching templates: %s", error_detail)
+                return []
+            except Exception as e:
+                logger.error("Error fetching templates: %s", e)
+                return []
+
+            self._template_index = {t["name"]: t for t in templates}
+            self._templates = templates
+            self._templates_fetched_at = time.monotonic()
+        logger.info("Retrieved %s templates via PyWa", len(templates))
+        return templates
+
+    def _fresh_templates(self) -> Optional[List[Dict[str, Any]]]:
+        """Cached template list if still within its TTL, else None"""
+        if (
+            self._templates is not None
+            and time.monotonic() - self._templates_fetched_at < TEMPLATE_CACHE_TTL_SECONDS
+        ):
+            return self._templates
+        return None
 
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if hasattr(e, 'response') else str(e)
-            logger.error(f"WhatsApp API error fetching templates: {error_detail}")
-            return []
-        except Exception as e:
-            logger.error(f"Error fetching templates: {e}")
-            return []
+    def _invalidate_template_cache(self) -> None:
+        """Force the next template lookup to refetch from the Graph API"""
+        self._templates = None
+        self._template_index = {}
 
     async def get_template_by_name(self, template_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -793,8 +959,9 @@ class WhatsAppService:
         Returns:
             Template dictionary or None if not found
         """
-        templates = await self.get_templates()
-        return next((t for t in templates if t.get("name") == template_name), None)
+        if not await self.get_templates():
+            return None
+        return self._template_index.get(template_name)
 
     async def create_template(
         self,
@@ -822,7 +989,7 @@ class WhatsAppService:
             TemplateResult with success status and template ID
         """
         if not self.is_configured:
-            logger.warning(f"[DEV MODE] Template creation: {name}")
+            logger.warning("[DEV MODE] Template creation: %s", name)
             return TemplateResult(
                 success=True,
                 template_id=f"dev_template_{name}",
@@ -880,8 +1047,9 @@ class WhatsAppService:
                 components=pywa_components,
             )
 
-            result = self._client.create_template(template=template_obj)
-            logger.info(f"Template created successfully via PyWa: {name}")
+            result = await asyncio.to_thread(self._client.create_template, template=template_obj)
+            self._invalidate_template_cache()
+            logger.info("Template created successfully via PyWa: %s", name)
             return TemplateResult(
                 success=True,
                 template_id=getattr(result, 'id', None),
@@ -891,10 +1059,10 @@ class WhatsAppService:
 
         except httpx.HTTPStatusError as e:
             error_detail = e.response.text if hasattr(e, 'response') else str(e)
-            logger.error(f"WhatsApp API error creating template: {error_detail}")
+            logger.error("WhatsApp API error creating template: %s", error_detail)
             return TemplateResult(success=False, template_name=name, error=f"API Error: {error_detail}")
         except Exception as e:
-            logger.error(f"Error creating template: {e}")
+            logger.error("Error creating template: %s", e)
             return TemplateResult(success=False, template_name=name, error=str(e))
 
     async def delete_template(self, template_name: str) -> TemplateResult:
@@ -908,7 +1076,7 @@ class WhatsAppService:
             TemplateResult with success status
         """
         if not self.is_configured:
-            logger.warning(f"[DEV MODE] Template deletion: {template_name}")
+            logger.warning("[DEV MODE] Template deletion: %s", template_name)
             return TemplateResult(success=True, template_name=template_name)
 
         if not settings.WHATSAPP_BUSINESS_ACCOUNT_ID:
@@ -926,20 +1094,21 @@ class WhatsAppService:
             )
 
         try:
-            self._client.delete_template(template_name=template_name)
-            logger.info(f"Template deleted successfully via PyWa: {template_name}")
+            await asyncio.to_thread(self._client.delete_template, template_name=template_name)
+            self._invalidate_template_cache()
+            logger.info("Template deleted successfully via PyWa: %s", template_name)
             return TemplateResult(success=True, template_name=template_name)
 
         except httpx.HTTPStatusError as e:
             error_detail = e.response.text if hasattr(e, 'response') else str(e)
-            logger.error(f"WhatsApp API error deleting template: {error_detail}")
+            logger.error("WhatsApp API error deleting template: %s", error_detail)
             return TemplateResult(
                 success=False,
                 template_name=template_name,
                 error=f"API Error: {error_detail}",
             )
         except Exception as e:
-            logger.error(f"Error deleting template: {e}")
+            logger.error("Error deleting template: %s", e)
             return TemplateResult(success=False, template_name=template_name, error=str(e))
 
     # ==================== STATUS & UTILITY METHODS ====================
@@ -954,13 +1123,13 @@ class WhatsAppService:
         Returns:
             Internal MessageStatus enum value
         """
-        status_mapping = {
-            "sent": MessageStatus.SENT,
-            "delivered": MessageStatus.DELIVERED,
-            "read": MessageStatus.READ,
-            "failed": MessageStatus.FAILED,
-        }
-        return status_mapping.get(wa_status.lower(), MessageStatus.QUEUED)
+        if not wa_status:
+            return MessageStatus.QUEUED
+        # Webhooks already send lowercase statuses, so lower() is only the fallback
+        status = _WA_STATUS_MAP.get(wa_status)
+        if status is None:
+            status = _WA_STATUS_MAP.get(wa_status.lower(), MessageStatus.QUEUED)
+        return status
 
     async def mark_message_as_read(self, message_id: str) -> bool:
         """
@@ -975,10 +1144,10 @@ class WhatsAppService:
         if not self.is_configured:
             return True
         try:
-            await self._client.mark_message_as_read(message_id=message_id)
+            await asyncio.to_thread(self._client.mark_message_as_read, message_id=message_id)
             return True
         except Exception as e:
-            logger.error(f"Error marking message as read: {e}")
+            logger.error("Error marking message as read: %s", e)
             return False
 
 
@@ -996,12 +1165,17 @@ def _extract_message_id(data: dict) -> str:
 
 def _serialize_template(template: Any) -> Dict[str, Any]:
     """Convert a PyWa template object into a plain dict."""
+    # getattr with a default instead of hasattr + access: one probe per field, and
+    # errors raised inside pywa properties are not silently swallowed
+    status = getattr(template, 'status', None)
+    category = getattr(template, 'category', None)
+    language = getattr(template, 'language', None)
     return {
         "id": getattr(template, 'id', None),
         "name": getattr(template, 'name', None),
-        "status": template.status.value if hasattr(template, 'status') else None,
-        "category": template.category.value if hasattr(template, 'category') else None,
-        "language": template.language.value if hasattr(template, 'language') else None,
+        "status": status.value if status is not None else None,
+        "category": category.value if category is not None else None,
+        "language": language.value if language is not None else None,
         "components": getattr(template, 'components', []),
     }
 
@@ -1053,10 +1227,7 @@ async def send_whatsapp_otp(phone_number: str, otp_code: str) -> dict:
     Returns:
         dict with success status and message ID
     """
-    result = await whatsapp_service.send_otp_message(phone_number, otp_code)
-    if result.success:
-        return {"success": True, "message_id": result.message_id, "phone_number": result.phone_number}
-    return {"success": False, "error": result.error, "error_code": result.error_code}
+    return (await whatsapp_service.send_otp_message(phone_number, otp_code)).as_dict()
 
 
 async def send_template_message(
@@ -1083,13 +1254,19 @@ async def send_template_message(
         language_code=language_code,
         body_params=params,
     )
-    if result.success:
-        return {"success": True, "message_id": result.message_id, "phone_number": result.phone_number}
-    return {"success": False, "error": result.error, "error_code": result.error_code}
+    return result.as_dict()
 
 
 # ==================== PHONE NUMBER UTILITIES ====================
 
+# Phone number patterns, compiled once at import
+_PHONE_FORMATTING_RE = re.compile(r'[\s\-\(\)]')
+_INDIAN_MOBILE_RE = re.compile(r'^[6-9]\d{9}$')
+_E164_RE = re.compile(r'^\+[1-9]\d{1,14}$')
+# Looser send-time check on the normalized number: it may still lack the leading '+'
+_SENDABLE_PHONE_RE = re.compile(r'^\+?[1-9]\d{7,14}$')
+
+
 def normalize_phone_number(phone_number: str) -> str:
     """
     Normalize phone number to E.164 format
@@ -1101,13 +1278,13 @@ def normalize_phone_number(phone_number: str) -> str:
     Returns:
         str: Phone number in E.164 format (+919876543210)
     """
-    cleaned = re.sub(r'[\s\-\(\)]', '', phone_number)
+    cleaned = _PHONE_FORMATTING_RE.sub('', phone_number)
 
     if cleaned.startswith('+91'):
         return cleaned
     if cleaned.startswith('91') and len(cleaned) == 12:
         return '+' + cleaned
-    if re.match(r'^[6-9]\d{9}$', cleaned):
+    if _INDIAN_MOBILE_RE.match(cleaned):
         return '+91' + cleaned
 
     return cleaned
@@ -1124,5 +1301,4 @@ def validate_phone_number(phone_number: str) -> bool:
         bool: True if valid E.164 format
     """
     normalized = normalize_phone_number(phone_number)
-    pattern = r'^\+[1-9]\d{1,14}$'
-    return bool(re.match(pattern, normalized))
\ No newline at end of file
+    return bool(_E164_RE.match(normalized))
\ No newline at end of file
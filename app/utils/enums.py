@@ -51,6 +51,7 @@ class CampaignStatus(str, Enum):
 class MessageStatus(str, Enum):
     """WhatsApp message delivery status"""
     QUEUED = "QUEUED"
+    SENDING = "SENDING"  # Claimed by a send task; the Graph API call is in flight
     SENT = "SENT"
     DELIVERED = "DELIVERED"
     READ = "READ"
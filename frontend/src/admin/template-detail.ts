@@ -39,7 +39,7 @@ interface Template {
     category: string;
     is_active: boolean;
     variable_count: number;
-    variable_names: string | null;
+    variable_names: string[] | null;
     translations: TemplateTranslation[];
     created_at: string;
     updated_at: string;
@@ -64,7 +64,7 @@ interface TemplatePreviewResponse {
     campaign_type: string;
     category: string;
     variable_count: number;
-    variable_names: string | null;
+    variable_names: string[] | null;
     dummy_values: Record<string, string>;
     translations: TranslationPreview[];
 }
@@ -114,7 +114,7 @@ document.addEventListener('DOMContentLoaded', () => {
 async function loadTemplate(): Promise<void> {
     try {
         const data = await apiRequest<{ templates: Template[]; total: number }>(
-            '/templates/admin/all',
+            `/templates/admin/all?after_id=${templateId - 1}&page_size=1`,
             authService
         );
         const found = (data.templates ?? (data as unknown as Template[])).find(
@@ -141,8 +141,8 @@ function renderPage(): void {
     document.getElementById('templateStatusBadge')!.innerHTML = createStatusBadge(overallStatus);
 
     // Meta info
-    const vars = template.variable_names
-        ? template.variable_names.split(',').map(v => `<code style="background:#f3f4f6;padding:2px 6px;border-radius:4px;font-size:12px;">${escapeHtml(v.trim())}</code>`).join(' ')
+    const vars = template.variable_names?.length
+        ? template.variable_names.map(v => `<code style="background:#f3f4f6;padding:2px 6px;border-radius:4px;font-size:12px;">${escapeHtml(v)}</code>`).join(' ')
         : '—';
 
     document.getElementById('metaGrid')!.innerHTML = `
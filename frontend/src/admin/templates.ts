@@ -51,7 +51,7 @@ interface TemplatePreviewResponse {
     description: string | null;
     category: string;
     variable_count: number;
-    variable_names: string | null;
+    variable_names: string[] | null;
     dummy_values: Record<string, string>;
     translations: TranslationPreview[];
 }
@@ -66,7 +66,7 @@ interface Template {
     category: string;
     is_active: boolean;
     variable_count: number;
-    variable_names: string | null;
+    variable_names: string[] | null;
     translations: TemplateTranslation[];
     created_at: string;
     updated_at: string;
@@ -102,6 +102,8 @@ interface TemplateUpdatePayload {
 
 // ─── State ────────────────────────────────────────────────────────────────────
 
+const TEMPLATE_PAGE_SIZE = 500;  // Server-side max page size for /templates/admin/all
+
 let allTemplates: Template[] = [];
 let currentFilter = 'all';
 
@@ -145,11 +147,7 @@ function setupFilterTabs(): void {
 async function loadTemplates(): Promise<void> {
     setTableLoading(true);
     try {
-        const data = await apiRequest<TemplateListResponse>(
-            '/templates/admin/all',
-            authService
-        );
-        allTemplates = data.templates ?? (data as unknown as Template[]);
+        allTemplates = await fetchAllTemplates();
         updateBadges();
         renderTemplates();
     } catch (error) {
@@ -158,6 +156,24 @@ async function loadTemplates(): Promise<void> {
     }
 }
 
+// The endpoint is paginated; follow the after_id cursor until a short page ends the list
+async function fetchAllTemplates(): Promise<Template[]> {
+    const templates: Template[] = [];
+    let afterId = 0;
+    for (;;) {
+        const data = await apiRequest<TemplateListResponse>(
+            `/templates/admin/all?page_size=${TEMPLATE_PAGE_SIZE}&after_id=${afterId}`,
+            authService
+        );
+        const page = data.templates ?? [];
+        templates.push(...page);
+        if (page.length < TEMPLATE_PAGE_SIZE) {
+            return templates;
+        }
+        afterId = page[page.length - 1].id;
+    }
+}
+
 function setTableLoading(isLoading: boolean): void {
     if (isLoading) {
         templatesTable.innerHTML = '<tr><td colspan="7" class="text-center">Loading…</td></tr>';
@@ -30,7 +30,7 @@ interface Template {
     category: string;
     is_active: boolean;
     variable_count: number;
-    variable_names: string | null;
+    variable_names: string[] | null;
     translations: TemplateTranslation[];
     created_at: string;
     updated_at: string;
@@ -63,7 +63,7 @@ interface TemplatePreviewResponse {
     description: string | null;
     category: string;
     variable_count: number;
-    variable_names: string | null;
+    variable_names: string[] | null;
     dummy_values: Record<string, string>;
     translations: TranslationPreview[];
 }
@@ -0,0 +1,50 @@
+"""
+Migration: Add SENDING to messages.status.
+
+send_campaign_message now claims a message by committing QUEUED -> SENDING
+in its own short transaction before calling the Graph API, instead of holding
+a SELECT ... FOR UPDATE row lock open across the HTTP request.
+
+This migration:
+1. Adds 'SENDING' to the status enum (MySQL ENUM column / PostgreSQL enum type)
+"""
+
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+from app.utils.enums import MessageStatus
+
+
+def column_type(conn, table, column):
+    result = conn.execute(text(
+        "SELECT COLUMN_TYPE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :tbl AND COLUMN_NAME = :col"
+    ), {"tbl": table, "col": column})
+    return result.scalar() or ""
+
+
+def run_migration():
+    dialect = engine.dialect.name
+    with engine.connect() as conn:
+        if dialect == "mysql":
+            if "'SENDING'" in column_type(conn, "messages", "status"):
+                print("messages.status already allows SENDING — nothing to do.")
+                return
+            values = ", ".join(f"'{s.name}'" for s in MessageStatus)
+            print(f"Altering messages.status to ENUM({values})")
+            conn.execute(text(f"ALTER TABLE messages MODIFY status ENUM({values}) NOT NULL"))
+        elif dialect == "postgresql":
+            print("Adding SENDING to enum type messagestatus")
+            conn.execute(text("ALTER TYPE messagestatus ADD VALUE IF NOT EXISTS 'SENDING' AFTER 'QUEUED'"))
+        else:
+            print(f"{dialect} stores messages.status without an enum constraint — nothing to do.")
+            return
+        conn.commit()
+
+        print("\n✅ Migration complete!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,63 @@
+"""
+Migration: Store templates.variable_names as a native JSON array.
+
+Older rows hold variable names as a comma-joined TEXT value
+("customer_name,due_date"), which every reader had to re-split.
+The model now declares the column as JSON, so rows hold
+["customer_name", "due_date"] directly.
+
+This migration:
+1. Rewrites existing comma-joined values as JSON arrays
+2. Changes the column type from TEXT to JSON
+"""
+
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+from sqlalchemy import text
+from app.database import engine
+
+
+def column_type(conn, table, column):
+    result = conn.execute(text(
+        "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :tbl AND COLUMN_NAME = :col"
+    ), {"tbl": table, "col": column})
+    return (result.scalar() or "").lower()
+
+
+def run_migration():
+    with engine.connect() as conn:
+        if column_type(conn, "templates", "variable_names") == "json":
+            print("templates.variable_names is already JSON — nothing to do.")
+            return
+
+        # ── Step 1: Rewrite CSV values as JSON arrays ────────────────────────
+        rows = conn.execute(text(
+            "SELECT id, variable_names FROM templates WHERE variable_names IS NOT NULL"
+        )).fetchall()
+
+        for tid, raw in rows:
+            raw = (raw or "").strip()
+            if raw.startswith("["):
+                continue  # Already a JSON array
+            names = [v.strip() for v in raw.split(",") if v.strip()]
+            conn.execute(text(
+                "UPDATE templates SET variable_names = :names WHERE id = :tid"
+            ), {"names": json.dumps(names) if names else None, "tid": tid})
+
+        conn.commit()
+        print(f"Converted {len(rows)} template(s) to JSON arrays.")
+
+        # ── Step 2: Change column type ───────────────────────────────────────
+        conn.execute(text(
+            "ALTER TABLE templates MODIFY variable_names JSON NULL"
+        ))
+        conn.commit()
+
+        print("\n✅ Migration complete!")
+
+
+if __name__ == "__main__":
+    run_migration()
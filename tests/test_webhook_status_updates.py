@@ -0,0 +1,70 @@
+"""
+Tests for collapsing WhatsApp status callbacks before they are written.
+Run from project root:  python -m pytest tests
+"""
+from datetime import datetime
+
+from app.services.template_service import _collapse_status_updates, _is_forward_transition
+from app.utils.enums import MessageStatus
+
+RECEIVED_AT = datetime(2024, 1, 1)
+
+
+def _status(wa_id: str, status: str, timestamp: int, **extra) -> dict:
+    return {"id": wa_id, "status": status, "timestamp": str(timestamp), **extra}
+
+
+def test_multi_status_payload_keeps_furthest_status_per_message():
+    transitions = _collapse_status_updates(
+        [
+            _status("A", "read", 1700000010),
+            _status("B", "delivered", 1700000005),
+            _status("B", "read", 1700000009),
+        ],
+        RECEIVED_AT,
+    )
+
+    assert transitions["A"]["status"] == MessageStatus.READ
+    assert transitions["B"]["status"] == MessageStatus.READ
+    # The superseded step still contributes its lifecycle timestamp
+    assert transitions["B"]["timestamps"] == {
+        "delivered_at": datetime.utcfromtimestamp(1700000005),
+        "read_at": datetime.utcfromtimestamp(1700000009),
+    }
+
+
+def test_out_of_order_callbacks_never_step_backwards():
+    transitions = _collapse_status_updates(
+        [
+            _status("B", "read", 1700000009),
+            _status("B", "delivered", 1700000005),
+            _status("B", "sent", 1700000001),
+        ],
+        RECEIVED_AT,
+    )
+
+    assert transitions["B"]["status"] == MessageStatus.READ
+    assert set(transitions["B"]["timestamps"]) == {"sent_at", "delivered_at", "read_at"}
+
+
+def test_failed_keeps_reason_and_unknown_statuses_are_ignored():
+    transitions = _collapse_status_updates(
+        [
+            _status("C", "sent", 1700000001),
+            _status("C", "failed", 1700000002, errors=[{"message": "Re-engagement required"}]),
+            _status("D", "deleted", 1700000003),
+        ],
+        RECEIVED_AT,
+    )
+
+    assert transitions["C"]["status"] == MessageStatus.FAILED
+    assert transitions["C"]["reason"] == "Re-engagement required"
+    assert "D" not in transitions
+
+
+def test_forward_transition_against_stored_status():
+    assert _is_forward_transition(MessageStatus.SENDING, MessageStatus.SENT)
+    assert _is_forward_transition(MessageStatus.DELIVERED, MessageStatus.READ)
+    assert _is_forward_transition(MessageStatus.READ, MessageStatus.READ)
+    assert not _is_forward_transition(MessageStatus.READ, MessageStatus.DELIVERED)
+    assert not _is_forward_transition(MessageStatus.READ, MessageStatus.FAILED)